@@ -0,0 +1,47 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.harness import Result, load_results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare two stored benchmark runs and flag regressions.')
+    parser.add_argument('baseline', type=Path)
+    parser.add_argument('current', type=Path)
+    parser.add_argument('--tolerance', type=float, default=0.10, help='Allowed relative slowdown before failing')
+    args = parser.parse_args()
+
+    baseline: Dict[str, Result] = load_results(args.baseline)
+    current: Dict[str, Result] = load_results(args.current)
+    regressions: List[str] = []
+
+    print(f'{"benchmark":<40} {"ops/s":>12} {"delta":>8} {"p99 ms":>10} {"delta":>8}')
+
+    for name, result in current.items():
+        before: Optional[Result] = baseline.get(name)
+
+        if before is None:
+            print(f'{name:<40} {result.ops_per_sec:>12.1f} {"new":>8} {result.p99_ms:>10.3f} {"new":>8}')
+            continue
+
+        ops_delta: float = result.ops_per_sec / before.ops_per_sec - 1 if before.ops_per_sec else 0.0
+        p99_delta: float = result.p99_ms / before.p99_ms - 1 if before.p99_ms else 0.0
+
+        print(
+            f'{name:<40} {result.ops_per_sec:>12.1f} {ops_delta:>+8.1%} '
+            f'{result.p99_ms:>10.3f} {p99_delta:>+8.1%}'
+        )
+
+        if ops_delta < -args.tolerance or p99_delta > args.tolerance:
+            regressions.append(name)
+
+    for name in regressions:
+        print(f'REGRESSION {name}', file=sys.stderr)
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
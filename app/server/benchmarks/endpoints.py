@@ -0,0 +1,116 @@
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import uuid
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+os.environ.setdefault('CONFIG__RATE_LIMIT__ENABLED', 'false')
+
+import httpx
+
+from benchmarks.harness import Result, aload, print_results, save_results
+from benchmarks.seed import SEED_PASSWORD, seed, seed_email
+from src.main import app
+
+
+def expect(status: int) -> Callable[[httpx.Response], httpx.Response]:
+    def check(response: httpx.Response) -> httpx.Response:
+        if response.status_code != status:
+            raise RuntimeError(
+                f'{response.request.method} {response.request.url.path} returned '
+                f'{response.status_code}: {response.text}'
+            )
+
+        return response
+
+    return check
+
+
+async def run(args: argparse.Namespace) -> List[Result]:
+    if args.seed:
+        await seed(args.seed)
+
+    rows: int = max(args.seed, args.rows)
+    names = itertools.count()
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url='http://bench'
+        ) as client:
+            login = await client.post('/v1/auth/token', data={
+                'username': seed_email(0),
+                'password': SEED_PASSWORD,
+            })
+            headers: Dict[str, str] = {
+                'Authorization': f'Bearer {expect(200)(login).json()["access_token"]}'
+            }
+
+            async def health() -> None:
+                expect(200)(await client.get('/v1/health'))
+
+            async def token() -> None:
+                expect(200)(await client.post('/v1/auth/token', data={
+                    'username': seed_email(random.randrange(rows)),
+                    'password': SEED_PASSWORD,
+                }))
+
+            async def create_user() -> None:
+                expect(201)(await client.post('/v1/auth/create-user', params={
+                    'first_name': 'bench',
+                    'email': f'{uuid.uuid4().hex}@register.{args.domain}',
+                    'hashed_password': SEED_PASSWORD,
+                }))
+
+            async def update_me() -> None:
+                expect(200)(await client.patch('/v1/user/me', headers=headers, json={
+                    'first_name': f'bench{next(names)}',
+                }))
+
+            async def change_first_name() -> None:
+                expect(200)(await client.post('/v1/user/change-first-name', headers=headers, params={
+                    'first_name': f'bench{next(names)}',
+                }))
+
+            async def change_last_name() -> None:
+                expect(200)(await client.post('/v1/user/change-last-name', headers=headers, params={
+                    'last_name': f'bench{next(names)}',
+                }))
+
+            scenarios: List[Tuple[str, Callable[[], Awaitable[None]], int]] = [
+                ('GET /v1/health', health, args.iterations),
+                ('POST /v1/auth/token', token, args.hash_iterations),
+                ('POST /v1/auth/create-user', create_user, args.hash_iterations),
+                ('PATCH /v1/user/me', update_me, args.iterations),
+                ('POST /v1/user/change-first-name', change_first_name, args.iterations),
+                ('POST /v1/user/change-last-name', change_last_name, args.iterations),
+            ]
+
+            return [
+                await aload(name, fn, iterations, args.concurrency)
+                for name, fn, iterations in scenarios
+                if not args.only or any(only in name for only in args.only)
+            ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Drive the FastAPI app in process and measure endpoint latency.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed this many users before running')
+    parser.add_argument('--rows', type=int, default=1000, help='Number of seeded users to sample logins from')
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--hash-iterations', type=int, default=100, help='Iterations for endpoints that hash passwords')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--domain', default='bench.example.com')
+    parser.add_argument('--only', action='append', default=[], help='Run scenarios whose name contains this string')
+    args = parser.parse_args()
+
+    results: List[Result] = asyncio.run(run(args))
+
+    print_results(results)
+    save_results('endpoints', results)
+
+
+if __name__ == '__main__':
+    main()
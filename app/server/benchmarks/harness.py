@@ -0,0 +1,122 @@
+import asyncio
+import json
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+
+RESULTS_DIR: Path = Path(__file__).parent / 'results'
+
+
+@dataclass
+class Result:
+    name: str
+    iterations: int
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered: List[float] = sorted(samples)
+    index: int = min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)
+
+    return ordered[index]
+
+
+def summarize(name: str, samples: List[float], elapsed: float) -> Result:
+    return Result(
+        name=name,
+        iterations=len(samples),
+        ops_per_sec=len(samples) / elapsed if elapsed else 0.0,
+        p50_ms=statistics.median(samples) * 1000,
+        p99_ms=percentile(samples, 0.99) * 1000,
+    )
+
+
+def measure(name: str, fn: Callable[[], object], iterations: int, warmup: int = 10) -> Result:
+    for _ in range(warmup):
+        fn()
+
+    samples: List[float] = []
+    started: float = time.perf_counter()
+
+    for _ in range(iterations):
+        t0: float = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+
+    return summarize(name, samples, time.perf_counter() - started)
+
+
+async def aload(
+    name: str,
+    fn: Callable[[], Awaitable[object]],
+    iterations: int,
+    concurrency: int = 1,
+    warmup: int = 10
+) -> Result:
+    for _ in range(warmup):
+        await fn()
+
+    samples: List[float] = []
+    remaining: List[int] = [iterations]
+
+    async def worker() -> None:
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            t0: float = time.perf_counter()
+            await fn()
+            samples.append(time.perf_counter() - t0)
+
+    started: float = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return summarize(name, samples, time.perf_counter() - started)
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def save_results(suite: str, results: Iterable[Result], path: Optional[Path] = None) -> Path:
+    revision: str = git_revision()
+    path = path or RESULTS_DIR / f'{suite}-{revision}.json'
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    path.write_text(json.dumps({
+        'suite': suite,
+        'revision': revision,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'results': [asdict(result) for result in results],
+    }, indent=2))
+
+    return path
+
+
+def load_results(path: Path) -> Dict[str, Result]:
+    data: Dict[str, Any] = json.loads(path.read_text())
+
+    return {result['name']: Result(**result) for result in data['results']}
+
+
+def print_results(results: Iterable[Result]) -> None:
+    print(f'{"benchmark":<40} {"iter":>8} {"ops/s":>12} {"p50 ms":>10} {"p99 ms":>10}')
+
+    for result in results:
+        print(
+            f'{result.name:<40} {result.iterations:>8} {result.ops_per_sec:>12.1f} '
+            f'{result.p50_ms:>10.3f} {result.p99_ms:>10.3f}'
+        )
@@ -0,0 +1,63 @@
+import argparse
+import time
+from typing import List
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+
+from benchmarks.harness import Result, measure, print_results, save_results
+from src.commands.generate_keys import generate_private_key
+
+
+ALGORITHMS: List[str] = ['RS256', 'ES256', 'EdDSA']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare JWT sign/verify throughput per algorithm.')
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    payload = {'sub': 'user@example.com', 'exp': int(time.time()) + 3600}
+    results: List[Result] = []
+
+    for algorithm in ALGORITHMS:
+        private_key = generate_private_key(algorithm)
+        public_key = private_key.public_key()
+        private_pem: bytes = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        public_pem: bytes = public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        token: str = jwt.encode(payload, private_key, algorithm=algorithm)
+
+        results.append(measure(
+            f'{algorithm} sign (key object)',
+            lambda: jwt.encode(payload, private_key, algorithm=algorithm),
+            args.iterations,
+        ))
+        results.append(measure(
+            f'{algorithm} sign (PEM per call)',
+            lambda: jwt.encode(payload, private_pem, algorithm=algorithm),
+            args.iterations,
+        ))
+        results.append(measure(
+            f'{algorithm} verify (key object)',
+            lambda: jwt.decode(token, public_key, algorithms=[algorithm]),
+            args.iterations,
+        ))
+        results.append(measure(
+            f'{algorithm} verify (PEM per call)',
+            lambda: jwt.decode(token, public_pem, algorithms=[algorithm]),
+            args.iterations,
+        ))
+
+    print_results(results)
+    save_results('jwt_algorithms', results)
+
+
+if __name__ == '__main__':
+    main()
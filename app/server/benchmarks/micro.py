@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from benchmarks.harness import Result, aload, measure, print_results, save_results
+from benchmarks.seed import SEED_PASSWORD, seed_email
+from src.api.v1.services import CRUDService, HashService, JWTService
+from src.api.v1.services.cache import principal_cache
+from src.api.v1.services.jwt import jwt_keys
+from src.database import db_helper
+
+
+def hash_benchmarks(iterations: int) -> List[Result]:
+    hashed_password: str = HashService().hash(SEED_PASSWORD)
+
+    return [
+        measure('HashService.hash', lambda: HashService().hash(SEED_PASSWORD), iterations, warmup=1),
+        measure(
+            'HashService.validate',
+            lambda: HashService().validate(SEED_PASSWORD, hashed_password),
+            iterations,
+            warmup=1,
+        ),
+    ]
+
+
+def jwt_benchmarks(iterations: int) -> List[Result]:
+    jwt_keys.load()
+
+    payload = {'sub': seed_email(0), 'exp': int(time.time()) + 3600}
+    token: str = JWTService().encode(payload)
+
+    return [
+        measure('JWTService.encode', lambda: JWTService().encode(payload), iterations),
+        measure('JWTService.decode (cached)', lambda: JWTService().decode(token), iterations),
+        measure(
+            'JWTService.decode (verify)',
+            lambda: JWTService().decode(token, public_key=jwt_keys.public_key),
+            iterations,
+        ),
+    ]
+
+
+async def crud_benchmarks(iterations: int, rows: int) -> List[Result]:
+    results: List[Result] = []
+
+    async with db_helper.session_factory() as session:
+        results.append(await aload(
+            'CRUDService.get_user_by_email',
+            lambda: CRUDService().get_user_by_email(
+                session=session,
+                email=seed_email(random.randrange(rows))
+            ),
+            iterations,
+        ))
+
+        email: str = seed_email(0)
+        principal_cache.clear()
+
+        results.append(await aload(
+            'CRUDService.get_cached_user_by_email',
+            lambda: CRUDService().get_cached_user_by_email(
+                session=session,
+                email=email
+            ),
+            iterations,
+        ))
+
+    await db_helper.dispose()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Microbenchmarks for HashService, JWTService and CRUDService.')
+    parser.add_argument('--iterations', type=int, default=5000)
+    parser.add_argument('--hash-iterations', type=int, default=20)
+    parser.add_argument('--db', action='store_true', help='Include CRUDService benchmarks against the seeded database')
+    parser.add_argument('--rows', type=int, default=1000, help='Number of seeded users to sample from')
+    args = parser.parse_args()
+
+    results: List[Result] = hash_benchmarks(args.hash_iterations) + jwt_benchmarks(args.iterations)
+
+    if args.db:
+        results += asyncio.run(crud_benchmarks(args.iterations, args.rows))
+
+    print_results(results)
+    save_results('micro', results)
+
+
+if __name__ == '__main__':
+    main()
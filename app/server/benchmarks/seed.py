@@ -0,0 +1,95 @@
+import argparse
+import asyncio
+import csv
+import hashlib
+import sys
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from sqlalchemy import text
+
+from src.api.v1.services.hash import HashService
+from src.database import db_helper
+
+
+SEED_DOMAIN: str = 'bench.example.com'
+SEED_PASSWORD: str = 'bench-password'
+SEED_COLUMNS: Tuple[str, ...] = ('first_name', 'last_name', 'email', 'hashed_password')
+
+
+def seed_email(index: int) -> str:
+    return f'user{index}@{SEED_DOMAIN}'
+
+
+def seed_rows(start: int, stop: int, hashed_password: str) -> Iterator[Tuple[str, str, str, str]]:
+    for index in range(start, stop):
+        yield (
+            hashlib.md5(str(index).encode()).hexdigest()[:10],
+            hashlib.md5(str(index * 7).encode()).hexdigest()[:12],
+            seed_email(index),
+            hashed_password,
+        )
+
+
+async def seeded_count() -> int:
+    async with db_helper.session_factory() as session:
+        return (await session.execute(text(
+            'SELECT count(*) FROM users WHERE email LIKE :pattern'
+        ), {'pattern': f'%@{SEED_DOMAIN}'})).scalar_one()
+
+
+async def seed(rows: int, chunk: int = 100_000) -> int:
+    existing: int = await seeded_count()
+    hashed_password: str = HashService().hash(SEED_PASSWORD)
+
+    async with db_helper.session_factory() as session:
+        for start in range(existing, rows, chunk):
+            stop: int = min(start + chunk, rows)
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+
+            await raw_connection.driver_connection.copy_records_to_table(
+                'users',
+                records=seed_rows(start, stop, hashed_password),
+                columns=SEED_COLUMNS,
+            )
+            await session.commit()
+            print(f'seeded {stop}/{rows}', file=sys.stderr)
+
+        await session.execute(text('ANALYZE users'))
+        await session.commit()
+
+    return max(rows, existing)
+
+
+def write_csv(path: Path, rows: int) -> None:
+    hashed_password: str = HashService().hash(SEED_PASSWORD)
+
+    with path.open('w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(SEED_COLUMNS)
+        writer.writerows(seed_rows(0, rows, hashed_password))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Generate synthetic users for benchmarks.')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunk', type=int, default=100_000)
+    parser.add_argument('--output', type=Path, default=None, help='Write a CSV for import_users instead of seeding the database')
+    args = parser.parse_args()
+
+    output: Optional[Path] = args.output
+
+    if output is not None:
+        write_csv(output, args.rows)
+        return
+
+    async def run() -> None:
+        await seed(args.rows, args.chunk)
+        await db_helper.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
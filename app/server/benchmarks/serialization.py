@@ -0,0 +1,125 @@
+import argparse
+import asyncio
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from benchmarks.harness import Result, aload, measure, print_results, save_results
+from src.api.v1.auth.schemas import Token, UserRead
+from src.api.v1.schemas import UserBase, users_adapter
+from src.database import User
+from src.responses import APIResponse
+
+
+def make_user(index: int) -> User:
+    return User(
+        id=index,
+        activate=True,
+        first_name=f'first{index}',
+        last_name=f'last{index}',
+        email=f'user{index}@example.com',
+        hashed_password='$2b$12$' + 'x' * 53,
+    )
+
+
+def legacy_app(user: User, users: List[User]) -> FastAPI:
+    application: FastAPI = FastAPI(default_response_class=JSONResponse)
+
+    @application.get('/user', response_model=UserBase)
+    async def user_handler() -> User:
+        return user
+
+    @application.get('/register', response_model=UserRead)
+    async def register_handler() -> UserRead:
+        return UserRead(
+            user=UserBase.model_validate(user.__dict__),
+            token=Token(access_token='x' * 600, token_type='bearer'),
+        )
+
+    @application.get('/users', response_model=List[UserBase])
+    async def users_handler() -> List[User]:
+        return users
+
+    return application
+
+
+def fast_app(user: User, users: List[User]) -> FastAPI:
+    application: FastAPI = FastAPI(default_response_class=APIResponse)
+
+    @application.get('/user', response_model=UserBase)
+    async def user_handler() -> APIResponse:
+        return APIResponse(content=UserBase.model_validate(user))
+
+    @application.get('/register', response_model=UserRead)
+    async def register_handler() -> APIResponse:
+        return APIResponse(content=UserRead(
+            user=UserBase.model_validate(user),
+            token=Token(access_token='x' * 600, token_type='bearer'),
+        ))
+
+    @application.get('/users', response_model=List[UserBase])
+    async def users_handler() -> APIResponse:
+        return APIResponse(content=users_adapter.validate_python(users), adapter=users_adapter)
+
+    return application
+
+
+async def endpoint_benchmarks(iterations: int, page: int) -> List[Result]:
+    user: User = make_user(1)
+    users: List[User] = [make_user(index) for index in range(page)]
+    results: List[Result] = []
+
+    for label, application in (('legacy', legacy_app(user, users)), ('fast', fast_app(user, users))):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=application),
+            base_url='http://bench'
+        ) as client:
+            for path in ('/user', '/register', '/users'):
+                results.append(await aload(
+                    f'{label} GET {path}',
+                    lambda path=path: client.get(path),
+                    iterations,
+                ))
+
+    return results
+
+
+def render_benchmarks(iterations: int, page: int) -> List[Result]:
+    user: User = make_user(1)
+    users: List[User] = [make_user(index) for index in range(page)]
+    validated: List[UserBase] = users_adapter.validate_python(users)
+    content = [model.model_dump() for model in validated]
+
+    return [
+        measure('model_validate(user.__dict__)', lambda: UserBase.model_validate(user.__dict__), iterations),
+        measure('model_validate(user)', lambda: UserBase.model_validate(user), iterations),
+        measure(
+            f'JSONResponse render x{page}',
+            lambda: JSONResponse(content=content),
+            iterations,
+        ),
+        measure(
+            f'APIResponse render x{page}',
+            lambda: APIResponse(content=validated, adapter=users_adapter),
+            iterations,
+        ),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare the legacy and fast response serialization paths.')
+    parser.add_argument('--iterations', type=int, default=5000)
+    parser.add_argument('--page', type=int, default=100, help='Number of users in list responses')
+    args = parser.parse_args()
+
+    results: List[Result] = render_benchmarks(args.iterations, args.page)
+    results += asyncio.run(endpoint_benchmarks(args.iterations, args.page))
+
+    print_results(results)
+    save_results('serialization', results)
+
+
+if __name__ == '__main__':
+    main()
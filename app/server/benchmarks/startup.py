@@ -0,0 +1,107 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from benchmarks.harness import Result, print_results, save_results, summarize
+
+
+SERVER_DIR: Path = Path(__file__).parent.parent
+IMPORT_SCRIPT: str = 'import src.main'
+STARTUP_SCRIPT: str = '''
+import asyncio
+from src.main import app
+
+async def main():
+    async with app.router.lifespan_context(app):
+        pass
+
+asyncio.run(main())
+'''
+IMPORTTIME_PATTERN: re.Pattern = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def run_python(args: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=SERVER_DIR,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def importtime(module: str, env: Dict[str, str]) -> List[Tuple[str, int, int]]:
+    completed: subprocess.CompletedProcess = run_python(['-X', 'importtime', '-c', f'import {module}'], env)
+    entries: List[Tuple[str, int, int]] = []
+
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+
+        if match:
+            entries.append((match.group(4), int(match.group(1)), int(match.group(2))))
+
+    return entries
+
+
+def print_importtime(entries: List[Tuple[str, int, int]], top: int) -> None:
+    total: int = sum(self_us for _, self_us, _ in entries)
+
+    print(f'{len(entries)} modules, {total / 1000:.1f} ms total import time')
+    print(f'{"module":<60} {"self ms":>10} {"cumulative ms":>14}')
+
+    for name, self_us, cumulative_us in sorted(entries, key=lambda entry: entry[1], reverse=True)[:top]:
+        print(f'{name:<60} {self_us / 1000:>10.1f} {cumulative_us / 1000:>14.1f}')
+
+
+def startup(name: str, runs: int, env: Dict[str, str], script: str = STARTUP_SCRIPT) -> Result:
+    samples: List[float] = []
+    started: float = time.perf_counter()
+
+    for _ in range(runs):
+        t0: float = time.perf_counter()
+        run_python(['-c', script], env)
+        samples.append(time.perf_counter() - t0)
+
+    return summarize(name, samples, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Report import time and measure worker cold-start latency.')
+    parser.add_argument('--module', default='src.main')
+    parser.add_argument('--top', type=int, default=25)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument(
+        '--max-ms',
+        type=float,
+        default=2500.0,
+        help='Fail when lazy startup p50 exceeds this, 0 disables the check',
+    )
+    args = parser.parse_args()
+
+    print_importtime(importtime(args.module, {'CONFIG__LAZY_STARTUP': 'true'}), args.top)
+    print()
+
+    # The config is read while the app is built, so every row pays for it.
+    # Lazy startup only skips the JWT keys, the engine and the OpenAPI build in the lifespan.
+    results: List[Result] = [
+        startup('import only', args.runs, {'CONFIG__LAZY_STARTUP': 'true'}, IMPORT_SCRIPT),
+        startup('startup (eager)', args.runs, {'CONFIG__LAZY_STARTUP': 'false'}),
+        startup('startup (lazy)', args.runs, {'CONFIG__LAZY_STARTUP': 'true'}),
+    ]
+
+    print_results(results)
+    save_results('startup', results)
+
+    if args.max_ms and results[-1].p50_ms > args.max_ms:
+        print(f'FAIL lazy startup p50 {results[-1].p50_ms:.0f} ms > {args.max_ms} ms', file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import hashlib
+import random
+import sys
+from typing import Callable, List
+
+from sqlalchemy import text
+
+from benchmarks.harness import Result, aload, print_results, save_results
+from benchmarks.seed import SEED_DOMAIN, seed
+from src.api.v1.services.crud import CRUDService
+from src.api.v1.users.service import UserListService
+from src.database import db_helper
+
+
+async def run(args: argparse.Namespace) -> int:
+    if args.seed:
+        await seed(args.seed)
+
+    rows: int = args.seed or args.rows
+    pick: Callable[[], int] = lambda: random.randrange(rows)
+    results: List[Result] = []
+
+    async with db_helper.session_factory() as session:
+        results.append(await aload(
+            'login lookup lower(email)',
+            lambda: CRUDService().get_user_by_email(
+                session=session,
+                email=f'USER{pick()}@{SEED_DOMAIN}'
+            ),
+            args.iterations,
+        ))
+        results.append(await aload(
+            'search email prefix',
+            lambda: UserListService().search_users(
+                session=session,
+                query=f'user{pick()}@',
+                limit=20
+            ),
+            args.iterations,
+        ))
+        results.append(await aload(
+            'search name substring',
+            lambda: UserListService().search_users(
+                session=session,
+                query=hashlib.md5(str(pick()).encode()).hexdigest()[2:7],
+                limit=20
+            ),
+            args.iterations,
+        ))
+
+        if args.explain:
+            plan = await session.execute(text(
+                'EXPLAIN ANALYZE SELECT id FROM users '
+                "WHERE lower(email) LIKE 'user4242%' OR first_name ILIKE '%4242%' OR last_name ILIKE '%4242%' "
+                'LIMIT 20'
+            ))
+            print('\n'.join(row[0] for row in plan))
+
+    await db_helper.dispose()
+
+    print_results(results)
+    save_results('user_search', results)
+
+    slow: List[Result] = [result for result in results if result.p99_ms > args.threshold_ms]
+
+    for result in slow:
+        print(f'FAIL {result.name}: p99 {result.p99_ms:.2f} ms > {args.threshold_ms} ms', file=sys.stderr)
+
+    return 1 if slow else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure user lookup and search latency against the configured database.')
+    parser.add_argument('--seed', type=int, default=0, help=f'Insert users up to this many rows under @{SEED_DOMAIN} first')
+    parser.add_argument('--rows', type=int, default=10_000_000, help='Number of seeded rows to sample from when not seeding')
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--threshold-ms', type=float, default=10.0)
+    parser.add_argument('--explain', action='store_true')
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == '__main__':
+    main()
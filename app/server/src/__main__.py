@@ -0,0 +1,56 @@
+import os
+import tempfile
+from pathlib import Path
+
+import uvicorn
+
+from src.config import app
+
+
+def reset_multiprocess_dir(workers: int) -> None:
+    directory: str | None = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+
+    if directory is None:
+        if workers == 1:
+            return
+
+        directory = os.path.join(tempfile.gettempdir(), 'prometheus')
+        os.environ['PROMETHEUS_MULTIPROC_DIR'] = directory
+
+    path: Path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+
+    for file in path.glob('*.db'):
+        file.unlink()
+
+
+def main() -> None:
+    workers: int = app.server.workers or os.cpu_count() or 1
+
+    if workers > 1 and not app.redis.enabled:
+        raise SystemExit(
+            f'Running {workers} workers requires a shared revocation store: '
+            'set CONFIG__REDIS__ENABLED=true or CONFIG__SERVER__WORKERS=1'
+        )
+
+    os.environ['CONFIG__SERVER__WORKERS'] = str(workers)
+    reset_multiprocess_dir(workers)
+
+    uvicorn.run(
+        'src.main:app',
+        host=app.host,
+        port=app.port,
+        workers=workers,
+        loop=app.server.loop,
+        http=app.server.http,
+        backlog=app.server.backlog,
+        timeout_keep_alive=app.server.timeout_keep_alive,
+        limit_max_requests=app.server.limit_max_requests,
+        proxy_headers=app.server.proxy_headers,
+        forwarded_allow_ips=app.server.forwarded_allow_ips,
+        reload=False,
+    )
+
+
+if __name__ == '__main__':
+    main()
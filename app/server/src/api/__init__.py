@@ -1,3 +0,0 @@
-from .v1 import router as v1_router
-
-__all__ = ['v1_router']
\ No newline at end of file
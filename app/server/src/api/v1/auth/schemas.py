@@ -8,10 +8,14 @@ from src.api.v1.schemas import UserBase
 
 class TokenData(BaseModel):
     sub: Optional[EmailStr]
+    uid: Optional[int] = Field(default=None)
+    act: Optional[bool] = Field(default=None)
+    ver: Optional[int] = Field(default=None)
 
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: Optional[str] = Field(default=None)
 
 class UserAuth(BaseModel):
     password: str
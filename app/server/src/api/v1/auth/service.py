@@ -1,13 +1,19 @@
+import uuid
 from datetime import timedelta, datetime, timezone
-from typing import Optional, Dict
+from http import HTTPStatus
+from typing import Optional, Dict, Any
 
+from fastapi import HTTPException
+from jwt import InvalidTokenError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .schemas import Token, UserAuth
+from .schemas import Token, TokenData, UserAuth
 
 from src.api.v1.services.crud import CRUDService
 from src.api.v1.services.hash import HashService
 from src.api.v1.services.jwt import JWTService
+from src.api.v1.services.refresh import RefreshTokenService, RotateResult
+from src.api.v1.services.revocation import RevocationService
 
 from src.config import app
 from src.database import User
@@ -24,25 +30,57 @@ class AuthService:
             email=auth.email
         )
 
+        await session.commit()
+
         if not user:
             return None
 
-        if not HashService().validate(
+        if not await HashService().avalidate(
             password=auth.password,
             hashed_password=user.hashed_password
         ):
             return None
 
+        if HashService().needs_rehash(user.hashed_password):
+            try:
+                await CRUDService().change_hashed_password(
+                    session=session,
+                    user=user,
+                    hashed_password=await HashService().ahash(auth.password)
+                )
+            except HTTPException:
+                pass
+
         return user
 
+    @staticmethod
+    def token_data(
+        user: User
+    ) -> TokenData:
+        if not app.jwt.embed_principal:
+            return TokenData(sub=user.email)
+
+        return TokenData(
+            sub=user.email,
+            uid=user.id,
+            act=user.activate,
+            ver=user.token_version
+        )
+
     @staticmethod
     def create_access_token(
         payload: Dict,
         expires_delta: timedelta = app.jwt.access_token_ttl
     ) -> Token:
-        expire = datetime.now(timezone.utc) + expires_delta
+        now: datetime = datetime.now(timezone.utc)
 
-        payload.update({'exp': expire})
+        payload.update({
+            'exp': now + expires_delta,
+            'iat': now,
+            'iat_ms': int(now.timestamp() * 1000),
+            'jti': uuid.uuid4().hex,
+            'type': 'access'
+        })
 
         access_token: str = JWTService().encode(
             payload=payload
@@ -51,4 +89,143 @@ class AuthService:
         return Token(
             access_token=access_token,
             token_type='bearer'
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def encode_refresh_token(
+        subject: str,
+        family: str,
+        jti: str,
+        expires_delta: timedelta = app.jwt.refresh_token_ttl
+    ) -> str:
+        now: datetime = datetime.now(timezone.utc)
+
+        return JWTService().encode(
+            payload={
+                'sub': subject,
+                'type': 'refresh',
+                'fam': family,
+                'jti': jti,
+                'iat': now,
+                'iat_ms': int(now.timestamp() * 1000),
+                'exp': now + expires_delta
+            }
+        )
+
+    @staticmethod
+    async def issue_tokens(
+        session: AsyncSession,
+        user: User
+    ) -> Token:
+        token: Token = AuthService.create_access_token(
+            payload=AuthService.token_data(user).model_dump(exclude_none=True)
+        )
+
+        family: str = uuid.uuid4().hex
+        jti: str = uuid.uuid4().hex
+
+        await RefreshTokenService().store(session).create(
+            family=family,
+            jti=jti,
+            user_id=user.id,
+            ttl=app.jwt.refresh_token_ttl
+        )
+
+        token.refresh_token = AuthService.encode_refresh_token(
+            subject=user.email,
+            family=family,
+            jti=jti
+        )
+
+        return token
+
+    @staticmethod
+    async def refresh_tokens(
+        session: AsyncSession,
+        refresh_token: str
+    ) -> Token:
+        credentials_exception: HTTPException = HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED.value,
+            detail=[{'msg': 'Could not validate refresh token'}],
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+
+        try:
+            payload: Dict[str, Any] = JWTService().decode(
+                token=refresh_token
+            )
+        except InvalidTokenError:
+            raise credentials_exception
+
+        subject: Optional[str] = payload.get('sub')
+        family: Optional[str] = payload.get('fam')
+        jti: Optional[str] = payload.get('jti')
+
+        if payload.get('type') != 'refresh' or not subject or not family or not jti:
+            raise credentials_exception
+
+        if await RevocationService().is_revoked(payload):
+            raise credentials_exception
+
+        token_data: TokenData = TokenData(sub=subject)
+
+        if app.jwt.embed_principal:
+            user: Optional[User] = await CRUDService().get_user_by_email(
+                session=session,
+                email=subject
+            )
+
+            if user is None:
+                raise credentials_exception
+
+            token_data = AuthService.token_data(user)
+
+        new_jti: str = uuid.uuid4().hex
+
+        result: RotateResult = await RefreshTokenService().store(session).rotate(
+            family=family,
+            jti=jti,
+            new_jti=new_jti,
+            ttl=app.jwt.refresh_token_ttl
+        )
+
+        if result is not RotateResult.ROTATED:
+            raise credentials_exception
+
+        token: Token = AuthService.create_access_token(
+            payload=token_data.model_dump(exclude_none=True)
+        )
+        token.refresh_token = AuthService.encode_refresh_token(
+            subject=subject,
+            family=family,
+            jti=new_jti
+        )
+
+        return token
+
+    @staticmethod
+    async def logout(
+        session: AsyncSession,
+        payload: Dict[str, Any],
+        refresh_token: Optional[str] = None
+    ) -> None:
+        if payload.get('jti'):
+            await RevocationService().revoke_token(
+                jti=payload['jti'],
+                expires_at=payload['exp']
+            )
+
+        if refresh_token is None:
+            return
+
+        try:
+            refresh_payload: Dict[str, Any] = JWTService().decode(
+                token=refresh_token
+            )
+        except InvalidTokenError:
+            return
+
+        if refresh_payload.get('type') == 'refresh' and refresh_payload.get('sub') == payload['sub']:
+            await RefreshTokenService().store(session).revoke(
+                family=refresh_payload['fam']
+            )
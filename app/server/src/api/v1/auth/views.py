@@ -1,7 +1,7 @@
 from http import HTTPStatus
-from typing import Annotated, Optional
+from typing import Annotated, Optional, Dict, Any
 
-from fastapi import APIRouter, Query, Depends, HTTPException
+from fastapi import APIRouter, Query, Depends, HTTPException, Form
 from fastapi.security import OAuth2PasswordRequestForm
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,15 +11,17 @@ from .schemas import (
     UserRead,
     UserBase,
     Token,
-    TokenData,
     UserAuth
 )
 from .service import AuthService
 
+from src.api.v1.service import Service
 from src.api.v1.services.crud import CRUDService
 from src.api.v1.services.hash import HashService
+from src.api.v1.services.revocation import RevocationService
 
 from src.database import db_helper, User
+from src.responses import APIResponse
 
 
 router: APIRouter = APIRouter()
@@ -27,7 +29,8 @@ router: APIRouter = APIRouter()
 @router.post(
     path='/token',
     response_model=Token,
-    status_code=HTTPStatus.OK
+    status_code=HTTPStatus.OK,
+    dependencies=[Depends(Service().throttle_login)]
 )
 async def token_handler(
    session: Annotated[
@@ -56,17 +59,35 @@ async def token_handler(
             headers={'WWW-Authenticate': 'Bearer'}
         )
 
-    token: Token = AuthService().create_access_token(
-        payload=TokenData(
-            sub=auth.email
-        ).model_dump()
+    token: Token = await AuthService().issue_tokens(
+        session=session,
+        user=user
     )
-    return token
+    return APIResponse(content=token)
+
+@router.post(
+    path='/refresh',
+    response_model=Token,
+    status_code=HTTPStatus.OK
+)
+async def refresh_handler(
+    session: Annotated[
+        AsyncSession,
+        Depends(db_helper.session_getter),
+    ],
+    refresh_token: Annotated[str, Form()]
+):
+    token: Token = await AuthService().refresh_tokens(
+        session=session,
+        refresh_token=refresh_token
+    )
+    return APIResponse(content=token)
 
 @router.post(
     path='/create-user',
     response_model=UserRead,
-    status_code=HTTPStatus.CREATED
+    status_code=HTTPStatus.CREATED,
+    dependencies=[Depends(Service().throttle_register)]
 )
 async def register_handler(
     session: Annotated[
@@ -75,31 +96,57 @@ async def register_handler(
     ],
     user_create: Annotated[UserCreate, Query()]
 ):
-    user: User = await CRUDService().get_user_by_email(
+    user_create.hashed_password = await HashService().ahash(user_create.hashed_password)
+
+    user: Optional[User] = await CRUDService().create_user(
         session=session,
-        email=user_create.email
+        values=user_create.model_dump()
     )
 
-    if user:
+    if user is None:
         raise HTTPException(
             status_code=HTTPStatus.CONFLICT.value,
             detail=[{'msg': 'A user with this email already exists.'}]
         )
 
-    user_create.hashed_password = str(HashService().hash(user_create.hashed_password).decode())
-
-    user: User = await CRUDService().create_user(
+    token: Token = await AuthService().issue_tokens(
         session=session,
-        user=User(**user_create.model_dump())
+        user=user
+    )
+
+    return APIResponse(
+        content=UserRead(
+            user=UserBase.model_validate(user),
+            token=token
+        ),
+        status_code=HTTPStatus.CREATED.value
     )
 
-    token: Token = AuthService().create_access_token(
-        payload=TokenData(
-            sub=user.email
-        ).model_dump()
+@router.post(
+    path='/logout',
+    status_code=HTTPStatus.NO_CONTENT
+)
+async def logout_handler(
+    session: Annotated[
+        AsyncSession,
+        Depends(db_helper.session_getter),
+    ],
+    payload: Annotated[Dict[str, Any], Depends(Service().get_token_payload)],
+    refresh_token: Annotated[Optional[str], Form()] = None
+) -> None:
+    await AuthService().logout(
+        session=session,
+        payload=payload,
+        refresh_token=refresh_token
     )
 
-    return UserRead(
-        user=UserBase.model_validate(user.__dict__),
-        token=token
-    )
\ No newline at end of file
+@router.post(
+    path='/logout-all',
+    status_code=HTTPStatus.NO_CONTENT
+)
+async def logout_all_handler(
+    payload: Annotated[Dict[str, Any], Depends(Service().get_token_payload)]
+) -> None:
+    await RevocationService().revoke_user(
+        subject=payload['sub']
+    )
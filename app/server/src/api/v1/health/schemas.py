@@ -1,5 +1,42 @@
+from typing import List
+
 from pydantic import BaseModel
 
 
 class Health(BaseModel):
-    success: bool
\ No newline at end of file
+    success: bool
+
+class HashPoolStatsRead(BaseModel):
+    executor: str
+    max_workers: int
+    max_queue_depth: int
+    running: int
+    queued: int
+    completed: int
+    rejected: int
+    utilisation: float
+    wait_seconds_total: float
+    wait_seconds_max: float
+    run_seconds_total: float
+
+class CacheStatsRead(BaseModel):
+    maxsize: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_ratio: float
+
+class ReplicaStatusRead(BaseModel):
+    name: str
+    healthy: bool
+    failures: int
+    checked_at: float
+
+class Stats(BaseModel):
+    hash_pool: HashPoolStatsRead
+    principal_cache: CacheStatsRead
+    token_cache: CacheStatsRead
+    replicas: List[ReplicaStatusRead]
@@ -1,8 +1,14 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from .schemas import Health
+from .schemas import Health, HashPoolStatsRead, CacheStatsRead, ReplicaStatusRead, Stats
+
+from src.api.v1.service import Service
+from src.api.v1.services.cache import principal_cache, token_cache
+from src.api.v1.services.hash import HashService
+from src.database import db_helper
+from src.responses import APIResponse
 
 
 router: APIRouter = APIRouter()
@@ -12,7 +18,35 @@ router: APIRouter = APIRouter()
     response_model=Health,
     status_code=HTTPStatus.OK
 )
-def health_handler() -> Health:
-    return Health(
-        success=True,
-    )
\ No newline at end of file
+def health_handler() -> APIResponse:
+    return APIResponse(
+        content=Health(
+            success=True,
+        )
+    )
+
+@router.get(
+    path='/health/stats',
+    response_model=Stats,
+    status_code=HTTPStatus.OK,
+    dependencies=[Depends(Service().get_current_admin)]
+)
+def stats_handler() -> APIResponse:
+    return APIResponse(content=Stats(
+        hash_pool=HashPoolStatsRead.model_validate(
+            HashService().stats(),
+            from_attributes=True
+        ),
+        principal_cache=CacheStatsRead.model_validate(
+            principal_cache.stats,
+            from_attributes=True
+        ),
+        token_cache=CacheStatsRead.model_validate(
+            token_cache.stats,
+            from_attributes=True
+        ),
+        replicas=[
+            ReplicaStatusRead.model_validate(replica, from_attributes=True)
+            for replica in db_helper.replicas.replicas
+        ],
+    ))
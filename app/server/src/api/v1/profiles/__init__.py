@@ -0,0 +1,4 @@
+from .views import router
+
+
+__all__ = ['router']
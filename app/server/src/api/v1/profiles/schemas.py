@@ -0,0 +1,9 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ProfileRead(BaseModel):
+    id: str
+    size: int
+    created_at: datetime
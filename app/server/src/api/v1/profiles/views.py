@@ -0,0 +1,49 @@
+from http import HTTPStatus
+from pathlib import Path
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+
+from .schemas import ProfileRead
+
+from src.api.v1.service import Service
+from src.monitoring import profile_store
+
+
+router: APIRouter = APIRouter(
+    dependencies=[Depends(Service().get_current_admin)]
+)
+
+@router.get(
+    path='',
+    response_model=List[ProfileRead],
+    status_code=HTTPStatus.OK
+)
+def list_handler() -> List[ProfileRead]:
+    return [
+        ProfileRead.model_validate(entry, from_attributes=True)
+        for entry in profile_store.list()
+    ]
+
+@router.get(
+    path='/{profile_id}',
+    response_class=FileResponse,
+    status_code=HTTPStatus.OK
+)
+def download_handler(
+    profile_id: str
+) -> FileResponse:
+    path: Optional[Path] = profile_store.path(profile_id)
+
+    if path is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND.value,
+            detail=[{'msg': 'Profile not found'}]
+        )
+
+    return FileResponse(
+        path=path,
+        media_type='application/octet-stream',
+        filename=path.name
+    )
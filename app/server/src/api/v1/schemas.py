@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-from typing import Optional
+from typing import List, Optional
 
 from fastapi.security import OAuth2PasswordBearer
 
@@ -10,8 +10,20 @@ oauth2_scheme: OAuth2PasswordBearer = OAuth2PasswordBearer(
 )
 
 class UserBase(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     activate: bool
     first_name: str
     last_name: Optional[str]
-    email: str
\ No newline at end of file
+    email: str
+
+class Principal(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    email: str
+    activate: bool
+    token_version: int
+
+users_adapter: TypeAdapter[List[UserBase]] = TypeAdapter(List[UserBase])
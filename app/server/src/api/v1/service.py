@@ -1,58 +1,195 @@
 from http import HTTPStatus
 from jwt import InvalidTokenError
-from typing import Optional, Annotated
+from typing import Optional, Annotated, Dict, Any
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import OAuth2PasswordRequestForm
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .schemas import oauth2_scheme
+from .schemas import Principal, oauth2_scheme
 
 from src.api.v1.services.crud import CRUDService
 from src.api.v1.services.jwt import JWTService
+from src.api.v1.services.ratelimit import RateLimitService
+from src.api.v1.services.revocation import RevocationService
+from src.config import app
 from src.database import User, db_helper
 
 
 class Service:
+    @staticmethod
+    async def get_token_payload(
+        token: Annotated[str, Depends(oauth2_scheme)]
+    ) -> Dict[str, Any]:
+        credentials_exception: HTTPException = HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED.value,
+            detail=[{'msg': 'Could not validate credentials'}],
+            headers={'WWW-Authenticate': 'Bearer'}
+        )
+
+        try:
+            payload: Dict[str, Any] = JWTService().decode(
+                token=token
+            )
+        except InvalidTokenError:
+            raise credentials_exception
+
+        if payload.get('sub') is None or payload.get('type') == 'refresh':
+            raise credentials_exception
+
+        if await RevocationService().is_revoked(payload):
+            raise credentials_exception
+
+        return payload
+
     @staticmethod
     async def get_current_user(
         session: Annotated[
             AsyncSession,
-            Depends(db_helper.session_getter),
+            Depends(db_helper.read_session_getter),
         ],
         token: Annotated[str, Depends(oauth2_scheme)]
     ) -> User:
-        try:
-            payload = JWTService().decode(
-                token=token
-            )
+        payload: Dict[str, Any] = await Service.get_token_payload(
+            token=token
+        )
 
-            email: str = payload.get('sub')
+        user: Optional[User] = await CRUDService().get_cached_user_by_email(
+            session=session,
+            email=payload['sub'],
+            token_version=payload.get('ver')
+        )
 
-            if email is None:
-                raise HTTPException(
-                    status_code=HTTPStatus.UNAUTHORIZED.value,
-                    detail=[{'msg': 'Could not validate credentials'}],
-                    headers={'WWW-Authenticate': 'Bearer'}
-                )
+        await session.commit()
 
-        except InvalidTokenError:
+        if user is None:
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED.value,
                 detail=[{'msg': 'Could not validate credentials'}],
                 headers={'WWW-Authenticate': 'Bearer'}
             )
 
-        user: Optional[User] = await CRUDService().get_user_by_email(
-            session=session,
-            email=email
+        Service.check_principal(
+            payload=payload,
+            principal=Principal.model_validate(user)
         )
 
-        if user is None:
+        return user
+
+    @staticmethod
+    def check_principal(
+        payload: Dict[str, Any],
+        principal: Principal
+    ) -> None:
+        if payload.get('ver', principal.token_version) != principal.token_version:
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED.value,
                 detail=[{'msg': 'Could not validate credentials'}],
                 headers={'WWW-Authenticate': 'Bearer'}
             )
 
-        return user
\ No newline at end of file
+        if not principal.activate:
+            raise HTTPException(
+                status_code=HTTPStatus.FORBIDDEN.value,
+                detail=[{'msg': 'Inactive user'}]
+            )
+
+    @staticmethod
+    async def get_principal(
+        session: Annotated[
+            AsyncSession,
+            Depends(db_helper.read_session_getter),
+        ],
+        token: Annotated[str, Depends(oauth2_scheme)]
+    ) -> Principal:
+        payload: Dict[str, Any] = await Service.get_token_payload(
+            token=token
+        )
+
+        if {'uid', 'act', 'ver'} <= payload.keys():
+            principal: Principal = Principal(
+                id=payload['uid'],
+                email=payload['sub'],
+                activate=payload['act'],
+                token_version=payload['ver']
+            )
+        else:
+            user: Optional[User] = await CRUDService().get_cached_user_by_email(
+                session=session,
+                email=payload['sub'],
+                token_version=payload.get('ver')
+            )
+
+            await session.commit()
+
+            if user is None:
+                raise HTTPException(
+                    status_code=HTTPStatus.UNAUTHORIZED.value,
+                    detail=[{'msg': 'Could not validate credentials'}],
+                    headers={'WWW-Authenticate': 'Bearer'}
+                )
+
+            principal = Principal.model_validate(user)
+
+        Service.check_principal(
+            payload=payload,
+            principal=principal
+        )
+
+        return principal
+
+    @staticmethod
+    async def get_current_admin(
+        token: Annotated[str, Depends(oauth2_scheme)]
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = await Service.get_token_payload(
+            token=token
+        )
+
+        if payload['sub'].lower() not in {email.lower() for email in app.admin.emails}:
+            raise HTTPException(
+                status_code=HTTPStatus.FORBIDDEN.value,
+                detail=[{'msg': 'Not enough permissions'}]
+            )
+
+        return payload
+
+    @staticmethod
+    async def throttle_login(
+        request: Request,
+        token_form: Annotated[OAuth2PasswordRequestForm, Depends()]
+    ) -> None:
+        await RateLimitService().check(
+            scope='login',
+            request=request,
+            email=token_form.username
+        )
+
+    @staticmethod
+    async def throttle_register(
+        request: Request
+    ) -> None:
+        await RateLimitService().check(
+            scope='register',
+            request=request,
+            email=request.query_params.get('email')
+        )
+
+    @staticmethod
+    async def throttle_password_change(
+        request: Request,
+        token: Annotated[str, Depends(oauth2_scheme)]
+    ) -> None:
+        try:
+            email: Optional[str] = JWTService().decode(
+                token=token
+            ).get('sub')
+        except InvalidTokenError:
+            email = None
+
+        await RateLimitService().check(
+            scope='change-password',
+            request=request,
+            email=email
+        )
@@ -1,9 +1,11 @@
 from .hash import HashService
 from .jwt import JWTService
 from .crud import CRUDService
+from .ratelimit import RateLimitService
 
 __all__ = [
     'CRUDService',
     'HashService',
-    'JWTService'
-]
\ No newline at end of file
+    'JWTService',
+    'RateLimitService'
+]
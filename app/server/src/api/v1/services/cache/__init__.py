@@ -0,0 +1,9 @@
+from .cache import TTLCache, CacheStats, principal_cache, token_cache
+
+
+__all__ = [
+    'TTLCache',
+    'CacheStats',
+    'principal_cache',
+    'token_cache'
+]
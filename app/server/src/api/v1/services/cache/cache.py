@@ -0,0 +1,96 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from src.config import app
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+@dataclass
+class CacheStats:
+    maxsize: int
+    size: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups: int = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+    ) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.stats: CacheStats = CacheStats(maxsize=maxsize)
+
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        entry: Optional[Tuple[float, V]] = self._data.get(key)
+
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.stats.size = len(self._data)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+        self.stats.size = len(self._data)
+
+    def invalidate(self, key: K) -> None:
+        if self._data.pop(key, None) is not None:
+            self.stats.size = len(self._data)
+            self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.stats.size = 0
+
+
+principal_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+    maxsize=app.cache.principal_size,
+    ttl=app.cache.principal_ttl.total_seconds(),
+)
+
+token_cache: TTLCache[Tuple[bytes, str], Dict[str, Any]] = TTLCache(
+    maxsize=app.cache.token_size,
+    ttl=app.cache.token_ttl.total_seconds(),
+)
@@ -1,67 +1,192 @@
-from typing import Optional
+from typing import Optional, Dict, Any
 
-from sqlalchemy import Select
+from sqlalchemy import Select, update, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
-from src.api.v1.auth.schemas import UserCreate
 from src.api.v1.services import HashService
+from src.api.v1.services.cache import principal_cache
+from src.api.v1.services.revocation import RevocationService
 from src.database import User
 
 
 class CRUDService:
+    @staticmethod
+    def select_user_by_email(email: str) -> Select:
+        return Select(User).where(func.lower(User.email) == email.lower())
+
+    @staticmethod
+    def select_user_by_id(user_id: int) -> Select:
+        return Select(User).where(User.id == user_id)
+
     @staticmethod
     async def get_user_by_email(
         session: AsyncSession,
         email: str
     ) -> Optional[User]:
-        result = await session.execute(Select(User).where(User.email == email))
+        result = await session.execute(
+            CRUDService.select_user_by_email(email)
+        )
 
         return result.scalar_one_or_none()
 
     @staticmethod
-    async def create_user(
+    async def get_user_by_id(
         session: AsyncSession,
-        user: User
-    ) -> User:
-        session.add(user)
-        await session.commit()
+        user_id: int
+    ) -> Optional[User]:
+        result = await session.execute(
+            CRUDService.select_user_by_id(user_id)
+        )
+
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_cached_user_by_email(
+        session: AsyncSession,
+        email: str,
+        token_version: Optional[int] = None
+    ) -> Optional[User]:
+        snapshot: Optional[Dict[str, Any]] = principal_cache.get(email)
+
+        # Another worker bumped token_version after this snapshot was cached
+        if (
+            snapshot is not None
+            and token_version is not None
+            and token_version > snapshot['token_version']
+        ):
+            principal_cache.invalidate(email)
+            snapshot = None
+
+        if snapshot is not None:
+            user: User = User(**snapshot)
+            make_transient_to_detached(user)
+
+            return await session.merge(user, load=False)
+
+        user: Optional[User] = await CRUDService.get_user_by_email(
+            session=session,
+            email=email
+        )
+
+        # A lagging replica can still return the row from before the bump
+        if user is not None and token_version is not None and token_version > user.token_version:
+            session.info['primary'] = True
+
+            result = await session.execute(
+                CRUDService.select_user_by_email(email)
+                .execution_options(populate_existing=True)
+            )
+            user = result.scalar_one_or_none()
+
+        if user is not None:
+            principal_cache.set(email, {
+                attr.key: getattr(user, attr.key)
+                for attr in User.__mapper__.column_attrs
+                if attr.key != 'hashed_password'
+            })
 
         return user
 
     @staticmethod
-    async def change_first_name(
+    async def create_user(
         session: AsyncSession,
-        user: User,
-        first_name: str
-    ):
-        user.first_name = first_name
+        values: Dict[str, Any]
+    ) -> Optional[User]:
+        result = await session.execute(
+            insert(User)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+            .returning(User)
+        )
+        user: Optional[User] = result.scalar_one_or_none()
 
         await session.commit()
 
+        if user is not None:
+            principal_cache.invalidate(user.email)
+
         return user
 
     @staticmethod
-    async def change_last_name(
+    async def update_user(
         session: AsyncSession,
-        user: User,
-        last_name: Optional[str]
-    ):
-        user.last_name = last_name
+        user_id: int,
+        values: Dict[str, Any]
+    ) -> Optional[User]:
+        if 'activate' in values:
+            values = {**values, 'token_version': User.token_version + 1}
+
+        result = await session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values, last_updated_at=func.now())
+            .returning(User)
+        )
+        user: Optional[User] = result.scalar_one_or_none()
 
         await session.commit()
 
+        if user is not None:
+            principal_cache.invalidate(user.email)
+
+            if 'token_version' in values:
+                await RevocationService().revoke_user(
+                    subject=user.email
+                )
+
         return user
 
+    @staticmethod
+    async def change_first_name(
+        session: AsyncSession,
+        user_id: int,
+        first_name: str
+    ) -> Optional[User]:
+        return await CRUDService.update_user(
+            session=session,
+            user_id=user_id,
+            values={'first_name': first_name}
+        )
+
+    @staticmethod
+    async def change_last_name(
+        session: AsyncSession,
+        user_id: int,
+        last_name: Optional[str]
+    ) -> Optional[User]:
+        return await CRUDService.update_user(
+            session=session,
+            user_id=user_id,
+            values={'last_name': last_name}
+        )
+
     @staticmethod
     async def change_user_password(
         session: AsyncSession,
         user: User,
         password: str
-    ) -> User:
-        user.hashed_password = str(HashService().hash(
-            password=password
-        ).decode())
-
-        await session.commit()
+    ) -> Optional[User]:
+        return await CRUDService.update_user(
+            session=session,
+            user_id=user.id,
+            values={
+                'hashed_password': await HashService().ahash(
+                    password=password
+                ),
+                'token_version': User.token_version + 1
+            }
+        )
 
-        return user
\ No newline at end of file
+    @staticmethod
+    async def change_hashed_password(
+        session: AsyncSession,
+        user: User,
+        hashed_password: str
+    ) -> Optional[User]:
+        return await CRUDService.update_user(
+            session=session,
+            user_id=user.id,
+            values={'hashed_password': hashed_password}
+        )
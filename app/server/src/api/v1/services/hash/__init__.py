@@ -1,4 +1,12 @@
+from .hashers import Hasher, HasherRegistry, hashers
+from .pool import HashPoolStats
 from .service import HashService
 
 
-__all__ = ['HashService']
\ No newline at end of file
+__all__ = [
+    'HashService',
+    'HashPoolStats',
+    'Hasher',
+    'HasherRegistry',
+    'hashers'
+]
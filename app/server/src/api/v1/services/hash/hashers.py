@@ -0,0 +1,228 @@
+import base64
+import hashlib
+import hmac
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+import bcrypt
+
+from src.config import app
+
+
+BCRYPT_PATTERN: re.Pattern = re.compile(r'^\$2[aby]\$(0[4-9]|[12]\d|3[01])\$[./A-Za-z0-9]{53}$')
+
+
+class Hasher(ABC):
+    name: str
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        ...
+
+    @abstractmethod
+    def verify(self, password: str, encoded: str) -> bool:
+        ...
+
+    @abstractmethod
+    def identify(self, encoded: str) -> bool:
+        ...
+
+    @abstractmethod
+    def is_valid(self, encoded: str) -> bool:
+        ...
+
+    @abstractmethod
+    def needs_rehash(self, encoded: str) -> bool:
+        ...
+
+
+class BCryptHasher(Hasher):
+    name = 'bcrypt'
+
+    def __init__(self, rounds: int = 12) -> None:
+        self.rounds: int = rounds
+
+    def hash(self, password: str) -> str:
+        salt: bytes = bcrypt.gensalt(rounds=self.rounds)
+
+        return bcrypt.hashpw(password.encode('utf-8'), salt).decode()
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            return bcrypt.checkpw(
+                password=password.encode('utf-8'),
+                hashed_password=encoded.encode('utf-8'),
+            )
+        except ValueError:
+            return False
+
+    def identify(self, encoded: str) -> bool:
+        return encoded.startswith(('$2a$', '$2b$', '$2y$'))
+
+    def is_valid(self, encoded: str) -> bool:
+        return BCRYPT_PATTERN.match(encoded) is not None
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return encoded[4:6] != f'{self.rounds:02d}'
+
+
+class ScryptHasher(Hasher):
+    name = 'scrypt'
+
+    def __init__(self, n: int = 2 ** 14, r: int = 8, p: int = 1, dklen: int = 64) -> None:
+        if n & (n - 1):
+            raise ValueError('scrypt n must be a power of two')
+
+        self.n: int = n
+        self.r: int = r
+        self.p: int = p
+        self.dklen: int = dklen
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int, dklen: int) -> bytes:
+        return hashlib.scrypt(
+            password.encode('utf-8'),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=256 * n * r * p,
+            dklen=dklen,
+        )
+
+    def _params(self) -> str:
+        return f'ln={self.n.bit_length() - 1},r={self.r},p={self.p}'
+
+    def hash(self, password: str) -> str:
+        salt: bytes = os.urandom(16)
+        derived: bytes = self._derive(password, salt, self.n, self.r, self.p, self.dklen)
+
+        return '$'.join([
+            '',
+            self.name,
+            self._params(),
+            base64.b64encode(salt).decode(),
+            base64.b64encode(derived).decode(),
+        ])
+
+    def _parse(self, encoded: str) -> Tuple[int, int, int, bytes, bytes]:
+        _, name, params, salt, derived = encoded.split('$')
+        values: Dict[str, int] = {
+            key: int(value)
+            for key, value in (item.split('=') for item in params.split(','))
+        }
+
+        if name != self.name or values.keys() != {'ln', 'r', 'p'} or min(values.values()) < 1:
+            raise ValueError('Invalid scrypt parameters')
+
+        return (
+            2 ** values['ln'],
+            values['r'],
+            values['p'],
+            base64.b64decode(salt, validate=True),
+            base64.b64decode(derived, validate=True),
+        )
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            n, r, p, salt, expected = self._parse(encoded)
+            actual: bytes = self._derive(password, salt, n, r, p, len(expected))
+        except ValueError:
+            return False
+
+        return hmac.compare_digest(actual, expected)
+
+    def identify(self, encoded: str) -> bool:
+        return encoded.startswith(f'${self.name}$')
+
+    def is_valid(self, encoded: str) -> bool:
+        try:
+            _, _, _, salt, derived = self._parse(encoded)
+        except ValueError:
+            return False
+
+        return bool(salt) and bool(derived)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return encoded.split('$')[2] != self._params()
+
+
+class Argon2Hasher(Hasher):
+    name = 'argon2'
+
+    def __init__(self, time_cost: int = 3, memory_cost: int = 65536, parallelism: int = 4) -> None:
+        from argon2 import PasswordHasher
+
+        self._hasher: PasswordHasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+        )
+
+    def hash(self, password: str) -> str:
+        return self._hasher.hash(password)
+
+    def verify(self, password: str, encoded: str) -> bool:
+        from argon2.exceptions import VerificationError, InvalidHashError
+
+        try:
+            return self._hasher.verify(encoded, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def identify(self, encoded: str) -> bool:
+        return encoded.startswith('$argon2')
+
+    def is_valid(self, encoded: str) -> bool:
+        from argon2 import extract_parameters
+        from argon2.exceptions import InvalidHashError
+
+        try:
+            extract_parameters(encoded)
+        except InvalidHashError:
+            return False
+
+        return True
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return self._hasher.check_needs_rehash(encoded)
+
+
+class HasherRegistry:
+    def __init__(self, default: str) -> None:
+        self.default_name: str = default
+
+        self._hashers: Dict[str, Hasher] = {}
+
+    def register(self, hasher: Hasher) -> None:
+        self._hashers[hasher.name] = hasher
+
+    @property
+    def default(self) -> Hasher:
+        return self._hashers[self.default_name]
+
+    def get(self, name: str) -> Hasher:
+        return self._hashers[name]
+
+    def identify(self, encoded: str) -> Optional[Hasher]:
+        for hasher in self._hashers.values():
+            if hasher.identify(encoded):
+                return hasher
+
+        return None
+
+
+hashers: HasherRegistry = HasherRegistry(default=app.hash.algorithm)
+hashers.register(BCryptHasher(rounds=app.hash.bcrypt_rounds))
+hashers.register(ScryptHasher(n=app.hash.scrypt_n, r=app.hash.scrypt_r, p=app.hash.scrypt_p))
+
+try:
+    hashers.register(Argon2Hasher(
+        time_cost=app.hash.argon2_time_cost,
+        memory_cost=app.hash.argon2_memory_cost,
+        parallelism=app.hash.argon2_parallelism,
+    ))
+except ImportError:
+    if app.hash.algorithm == 'argon2':
+        raise
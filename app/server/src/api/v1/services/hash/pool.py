@@ -0,0 +1,116 @@
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+from src.config import app
+from src.monitoring import hash_duration_seconds, hash_wait_seconds, record
+
+
+class HashPoolSaturatedError(Exception):
+    pass
+
+
+@dataclass
+class HashPoolStats:
+    executor: str
+    max_workers: int
+    max_queue_depth: int
+    running: int = 0
+    queued: int = 0
+    completed: int = 0
+    rejected: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    run_seconds_total: float = 0.0
+
+    @property
+    def utilisation(self) -> float:
+        return self.running / self.max_workers
+
+
+def _timed(fn: Callable, *args: Any) -> Tuple[Any, float, float]:
+    started: float = time.monotonic()
+    result: Any = fn(*args)
+
+    return result, started, time.monotonic()
+
+
+class HashPool:
+    def __init__(
+        self,
+        executor: str = 'thread',
+        max_workers: Optional[int] = None,
+        max_queue_depth: int = 64,
+    ) -> None:
+        self.executor: str = executor
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.max_queue_depth: int = max_queue_depth
+        self.stats: HashPoolStats = HashPoolStats(
+            executor=executor,
+            max_workers=self.max_workers,
+            max_queue_depth=max_queue_depth,
+        )
+
+        self._executor: Optional[Executor] = None
+        self._in_flight: int = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='hash'
+                )
+
+        return self._executor
+
+    def _update_gauges(self) -> None:
+        self.stats.running = min(self._in_flight, self.max_workers)
+        self.stats.queued = max(self._in_flight - self.max_workers, 0)
+
+    async def run(self, fn: Callable, *args: Any) -> Any:
+        if self._in_flight >= self.max_workers + self.max_queue_depth:
+            self.stats.rejected += 1
+            raise HashPoolSaturatedError()
+
+        self._in_flight += 1
+        self._update_gauges()
+        submitted: float = time.monotonic()
+
+        try:
+            result, started, finished = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), _timed, fn, *args
+            )
+        finally:
+            self._in_flight -= 1
+            self._update_gauges()
+
+        wait: float = max(started - submitted, 0.0)
+
+        self.stats.completed += 1
+        self.stats.wait_seconds_total += wait
+        self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, wait)
+        self.stats.run_seconds_total += finished - started
+
+        hash_wait_seconds.labels(fn.__name__).observe(wait)
+        hash_duration_seconds.labels(fn.__name__).observe(finished - started)
+        record('hash', time.monotonic() - submitted)
+
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+hash_pool: HashPool = HashPool(
+    executor=app.hash.executor,
+    max_workers=app.hash.max_workers,
+    max_queue_depth=app.hash.max_queue_depth,
+)
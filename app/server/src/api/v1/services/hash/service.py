@@ -1,28 +1,98 @@
-import bcrypt
+import asyncio
+from http import HTTPStatus
+from typing import Any, Iterable, List, Optional
+
+from fastapi import HTTPException
+
+from .hashers import hashers, Hasher
+from .pool import hash_pool, HashPoolSaturatedError, HashPoolStats
+
+from src.config import app
 
 
 class HashService:
     @staticmethod
     def hash(
         password: str,
-    ) -> bytes:
+    ) -> str:
+        return hashers.default.hash(password)
+
+    @staticmethod
+    def validate(
+        password: str,
+        hashed_password: bytes | str
+    ) -> bool:
+        if isinstance(hashed_password, bytes):
+            hashed_password: str = hashed_password.decode('utf-8')
 
-        salt: bytes = bcrypt.gensalt()
-        pwd_bytes: bytes = password.encode()
+        hasher: Optional[Hasher] = hashers.identify(hashed_password)
 
-        return bcrypt.hashpw(pwd_bytes, salt)
+        if hasher is None:
+            return False
+
+        return hasher.verify(password, hashed_password)
 
     @staticmethod
-    def validate(
+    def needs_rehash(
+        hashed_password: str
+    ) -> bool:
+        hasher: Optional[Hasher] = hashers.identify(hashed_password)
+
+        return hasher is not hashers.default or hasher.needs_rehash(hashed_password)
+
+    @staticmethod
+    async def _run_in_pool(*args) -> Any:
+        try:
+            return await hash_pool.run(*args)
+        except HashPoolSaturatedError:
+            raise HTTPException(
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE.value,
+                detail=[{'msg': 'The server is busy, try again later'}],
+                headers={'Retry-After': str(app.hash.retry_after)}
+            )
+
+    @staticmethod
+    async def ahash(
+        password: str,
+    ) -> str:
+        return await HashService._run_in_pool(HashService.hash, password)
+
+    @staticmethod
+    async def avalidate(
         password: str,
         hashed_password: bytes | str
     ) -> bool:
-        password: bytes = password.encode('utf-8')
+        return await HashService._run_in_pool(
+            HashService.validate,
+            password,
+            hashed_password
+        )
+
+    @staticmethod
+    async def ahash_many(
+        passwords: Iterable[str],
+        concurrency: int
+    ) -> List[str]:
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+        async def ahash(password: str) -> str:
+            async with semaphore:
+                while True:
+                    try:
+                        return await hash_pool.run(HashService.hash, password)
+                    except HashPoolSaturatedError:
+                        await asyncio.sleep(max(app.hash.retry_after, 0.1))
 
-        if isinstance(hashed_password, str):
-            hashed_password: bytes = hashed_password.encode('utf-8')
+        return list(await asyncio.gather(*(ahash(password) for password in passwords)))
+
+    @staticmethod
+    def max_workers() -> int:
+        return hash_pool.max_workers
 
-        return bcrypt.checkpw(
-            password=password,
-            hashed_password=hashed_password,
-        )
\ No newline at end of file
+    @staticmethod
+    def stats() -> HashPoolStats:
+        return hash_pool.stats
+
+    @staticmethod
+    def shutdown() -> None:
+        hash_pool.shutdown()
@@ -1,4 +1,5 @@
+from .keys import jwt_keys, JWTKeys
 from .service import JWTService
 
 
-__all__ = ['JWTService']
\ No newline at end of file
+__all__ = ['JWTService', 'JWTKeys', 'jwt_keys']
@@ -0,0 +1,49 @@
+from pathlib import Path
+from typing import Any, Optional
+
+import jwt
+from jwt.algorithms import Algorithm
+
+from src.config import app
+
+
+class JWTKeys:
+    def __init__(
+        self,
+        algorithm: str,
+        private_key_path: Path,
+        public_key_path: Path,
+    ) -> None:
+        self.algorithm: str = algorithm
+        self.private_key_path: Path = private_key_path
+        self.public_key_path: Path = public_key_path
+
+        self._private_key: Optional[Any] = None
+        self._public_key: Optional[Any] = None
+
+    def load(self) -> None:
+        handler: Algorithm = jwt.get_algorithm_by_name(self.algorithm)
+
+        self._private_key = handler.prepare_key(self.private_key_path.read_bytes())
+        self._public_key = handler.prepare_key(self.public_key_path.read_bytes())
+
+    @property
+    def private_key(self) -> Any:
+        if self._private_key is None:
+            self.load()
+
+        return self._private_key
+
+    @property
+    def public_key(self) -> Any:
+        if self._public_key is None:
+            self.load()
+
+        return self._public_key
+
+
+jwt_keys: JWTKeys = JWTKeys(
+    algorithm=app.jwt.algorithm,
+    private_key_path=app.jwt.private_key,
+    public_key_path=app.jwt.public_key,
+)
@@ -1,34 +1,71 @@
+import hashlib
+import time
 import jwt
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
+from .keys import jwt_keys
+
+from src.api.v1.services.cache import token_cache
 from src.config import app
+from src.monitoring import jwt_duration_seconds, timed
 
 
 class JWTService:
     @staticmethod
     def encode(
         payload: Dict,
-        private_key: str = app.jwt.private_key.read_text(),
+        private_key: Optional[Any] = None,
         algorithm: str = app.jwt.algorithm
     ) -> str:
-        encoded: str = jwt.encode(
-            payload=payload,
-            key=private_key,
-            algorithm=algorithm,
-        )
+        with timed('jwt', jwt_duration_seconds.labels('encode')):
+            encoded: str = jwt.encode(
+                payload=payload,
+                key=jwt_keys.private_key if private_key is None else private_key,
+                algorithm=algorithm,
+            )
 
         return encoded
 
     @staticmethod
     def decode(
         token: str,
-        public_key: str = app.jwt.public_key.read_text(),
+        public_key: Optional[Any] = None,
         algorithm: str = app.jwt.algorithm
     ):
-        decoded: Any = jwt.decode(
-            jwt=token,
-            key=public_key,
-            algorithms=[algorithm]
+        if public_key is not None:
+            with timed('jwt', jwt_duration_seconds.labels('decode')):
+                return jwt.decode(
+                    jwt=token,
+                    key=public_key,
+                    algorithms=[algorithm]
+                )
+
+        cache_key: Tuple[bytes, str] = (
+            hashlib.sha256(token.encode()).digest(),
+            algorithm
+        )
+        cached: Optional[Dict[str, Any]] = token_cache.get(cache_key)
+
+        if cached is not None:
+            exp: Optional[float] = cached.get('exp')
+
+            if exp is None or exp > time.time():
+                return dict(cached)
+
+            token_cache.invalidate(cache_key)
+
+        with timed('jwt', jwt_duration_seconds.labels('decode')):
+            decoded: Any = jwt.decode(
+                jwt=token,
+                key=jwt_keys.public_key,
+                algorithms=[algorithm]
+            )
+
+        exp: Optional[float] = decoded.get('exp')
+        token_cache.set(
+            cache_key,
+            dict(decoded),
+            ttl=None if exp is None else exp - time.time()
         )
 
-        return decoded
\ No newline at end of file
+        return decoded
@@ -0,0 +1,4 @@
+from .service import RateLimitService
+
+
+__all__ = ['RateLimitService']
@@ -0,0 +1,181 @@
+import math
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from http import HTTPStatus
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Deque, List, Optional
+
+from fastapi import HTTPException, Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.config import app
+from src.storage import redis_helper
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    retry_after: float = 0.0
+
+
+class MemoryRateLimitBackend:
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self.max_keys: int = max_keys
+
+        self._hits: OrderedDict[str, Deque[float]] = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        now: float = time.monotonic()
+        hits: Deque[float] = self._hits.pop(key, None) or deque()
+
+        while hits and hits[0] <= now - window:
+            hits.popleft()
+
+        self._hits[key] = hits
+
+        while len(self._hits) > self.max_keys:
+            self._hits.popitem(last=False)
+
+        if len(hits) >= limit:
+            return RateLimitResult(
+                allowed=False,
+                retry_after=hits[0] + window - now
+            )
+
+        hits.append(now)
+
+        return RateLimitResult(allowed=True)
+
+
+class RedisRateLimitBackend:
+    def __init__(self, client: Redis, prefix: str = 'ratelimit') -> None:
+        self.client: Redis = client
+        self.prefix: str = prefix
+
+    async def hit(self, key: str, limit: int, window: float) -> RateLimitResult:
+        name: str = f'{self.prefix}:{key}'
+        now: float = time.time()
+        member: str = f'{now}:{uuid.uuid4().hex}'
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(name, 0, now - window)
+            pipe.zadd(name, {member: now})
+            pipe.zcard(name)
+            pipe.zrange(name, 0, 0, withscores=True)
+            pipe.expire(name, math.ceil(window))
+            _, _, count, oldest, _ = await pipe.execute()
+
+        if count > limit:
+            await self.client.zrem(name, member)
+
+            return RateLimitResult(
+                allowed=False,
+                retry_after=oldest[0][1] + window - now if oldest else window
+            )
+
+        return RateLimitResult(allowed=True)
+
+
+memory_backend: MemoryRateLimitBackend = MemoryRateLimitBackend(
+    max_keys=app.rate_limit.memory_max_keys
+)
+
+
+def parse_trusted_proxies(hosts: str) -> List[IPv4Network | IPv6Network]:
+    networks: List[IPv4Network | IPv6Network] = []
+
+    for host in hosts.split(','):
+        host = host.strip()
+
+        if host == '*':
+            networks.extend([ip_network('0.0.0.0/0'), ip_network('::/0')])
+        elif host:
+            networks.append(ip_network(host, strict=False))
+
+    return networks
+
+
+trusted_proxies: List[IPv4Network | IPv6Network] = parse_trusted_proxies(
+    app.server.forwarded_allow_ips
+)
+
+
+class RateLimitService:
+    @staticmethod
+    def is_trusted_proxy(host: str) -> bool:
+        try:
+            address = ip_address(host)
+        except ValueError:
+            return False
+
+        return any(address in network for network in trusted_proxies)
+
+    @staticmethod
+    def client_ip(request: Request) -> str:
+        if request.client is None:
+            return 'unknown'
+
+        host: str = request.client.host
+
+        if not RateLimitService.is_trusted_proxy(host):
+            return host
+
+        forwarded_for: Optional[str] = request.headers.get('x-forwarded-for')
+
+        if not forwarded_for:
+            return host
+
+        hops: List[str] = [hop.strip() for hop in forwarded_for.split(',') if hop.strip()]
+
+        for hop in reversed(hops):
+            if not RateLimitService.is_trusted_proxy(hop):
+                return hop
+
+        return hops[0] if hops else host
+
+    @staticmethod
+    async def hit(key: str, limit: int, window: float) -> RateLimitResult:
+        if redis_helper.client is not None:
+            try:
+                return await RedisRateLimitBackend(redis_helper.client).hit(key, limit, window)
+            except RedisError:
+                pass
+
+        return await memory_backend.hit(key, limit, window)
+
+    @staticmethod
+    async def check(
+        scope: str,
+        request: Request,
+        email: Optional[str] = None
+    ) -> None:
+        if not app.rate_limit.enabled:
+            return
+
+        window: float = app.rate_limit.window.total_seconds()
+        results: List[RateLimitResult] = [
+            await RateLimitService.hit(
+                key=f'{scope}:ip:{RateLimitService.client_ip(request)}',
+                limit=app.rate_limit.ip_limit,
+                window=window
+            )
+        ]
+
+        if email:
+            results.append(await RateLimitService.hit(
+                key=f'{scope}:email:{email.strip().lower()}',
+                limit=app.rate_limit.email_limit,
+                window=window
+            ))
+
+        denied: List[RateLimitResult] = [result for result in results if not result.allowed]
+
+        if denied:
+            raise HTTPException(
+                status_code=HTTPStatus.TOO_MANY_REQUESTS.value,
+                detail=[{'msg': 'Too many attempts, try again later'}],
+                headers={'Retry-After': str(math.ceil(max(result.retry_after for result in denied)))}
+            )
@@ -0,0 +1,8 @@
+from .service import RefreshTokenService, RefreshTokenStore, RotateResult
+
+
+__all__ = [
+    'RefreshTokenService',
+    'RefreshTokenStore',
+    'RotateResult'
+]
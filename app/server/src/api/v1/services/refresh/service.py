@@ -0,0 +1,139 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Optional
+
+from redis.asyncio import Redis
+from sqlalchemy import update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database import RefreshTokenFamily
+from src.storage import redis_helper
+
+
+class RotateResult(Enum):
+    ROTATED = 'rotated'
+    REUSED = 'reused'
+    UNKNOWN = 'unknown'
+
+
+class RefreshTokenStore(ABC):
+    @abstractmethod
+    async def create(self, family: str, jti: str, user_id: int, ttl: timedelta) -> None:
+        ...
+
+    @abstractmethod
+    async def rotate(self, family: str, jti: str, new_jti: str, ttl: timedelta) -> RotateResult:
+        ...
+
+    @abstractmethod
+    async def revoke(self, family: str) -> None:
+        ...
+
+
+class RedisRefreshTokenStore(RefreshTokenStore):
+    def __init__(self, client: Redis, prefix: str = 'refresh') -> None:
+        self.client: Redis = client
+        self.prefix: str = prefix
+
+    async def create(self, family: str, jti: str, user_id: int, ttl: timedelta) -> None:
+        await self.client.set(f'{self.prefix}:{family}', jti, ex=ttl)
+
+    async def rotate(self, family: str, jti: str, new_jti: str, ttl: timedelta) -> RotateResult:
+        current: Optional[str] = await self.client.getdel(f'{self.prefix}:{family}')
+
+        if current is None:
+            return RotateResult.UNKNOWN
+
+        if isinstance(current, bytes):
+            current = current.decode()
+
+        if current != jti:
+            return RotateResult.REUSED
+
+        await self.client.set(f'{self.prefix}:{family}', new_jti, ex=ttl)
+
+        return RotateResult.ROTATED
+
+    async def revoke(self, family: str) -> None:
+        await self.client.delete(f'{self.prefix}:{family}')
+
+
+class DatabaseRefreshTokenStore(RefreshTokenStore):
+    def __init__(self, session: AsyncSession) -> None:
+        self.session: AsyncSession = session
+
+    async def create(self, family: str, jti: str, user_id: int, ttl: timedelta) -> None:
+        self.session.add(RefreshTokenFamily(
+            id=family,
+            user_id=user_id,
+            current_jti=jti,
+            expires_at=datetime.now(timezone.utc) + ttl
+        ))
+
+        await self.session.commit()
+
+    async def rotate(self, family: str, jti: str, new_jti: str, ttl: timedelta) -> RotateResult:
+        rotated = await self.session.execute(
+            update(RefreshTokenFamily)
+            .where(
+                RefreshTokenFamily.id == family,
+                RefreshTokenFamily.current_jti == jti,
+                RefreshTokenFamily.revoked.is_(False),
+                RefreshTokenFamily.expires_at > func.now()
+            )
+            .values(
+                current_jti=new_jti,
+                expires_at=datetime.now(timezone.utc) + ttl,
+                last_updated_at=func.now()
+            )
+            .returning(RefreshTokenFamily.id)
+        )
+
+        if rotated.scalar_one_or_none() is not None:
+            await self.session.commit()
+
+            return RotateResult.ROTATED
+
+        revoked = await self.session.execute(
+            update(RefreshTokenFamily)
+            .where(
+                RefreshTokenFamily.id == family,
+                RefreshTokenFamily.revoked.is_(False)
+            )
+            .values(
+                revoked=True,
+                last_updated_at=func.now()
+            )
+            .returning(RefreshTokenFamily.id)
+        )
+        result: RotateResult = (
+            RotateResult.REUSED
+            if revoked.scalar_one_or_none() is not None
+            else RotateResult.UNKNOWN
+        )
+
+        await self.session.commit()
+
+        return result
+
+    async def revoke(self, family: str) -> None:
+        await self.session.execute(
+            update(RefreshTokenFamily)
+            .where(RefreshTokenFamily.id == family)
+            .values(
+                revoked=True,
+                last_updated_at=func.now()
+            )
+        )
+
+        await self.session.commit()
+
+
+class RefreshTokenService:
+    @staticmethod
+    def store(session: AsyncSession) -> RefreshTokenStore:
+        if redis_helper.client is not None:
+            return RedisRefreshTokenStore(redis_helper.client)
+
+        return DatabaseRefreshTokenStore(session)
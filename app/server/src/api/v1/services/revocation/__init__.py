@@ -0,0 +1,8 @@
+from .bloom import BloomFilter
+from .service import RevocationService
+
+
+__all__ = [
+    'BloomFilter',
+    'RevocationService'
+]
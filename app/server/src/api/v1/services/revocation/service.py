@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from redis.asyncio import Redis
+
+from .bloom import BloomFilter
+
+from src.config import app
+from src.storage import redis_helper
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class MemoryRevocationStore:
+    def __init__(self) -> None:
+        self._tokens: Dict[str, float] = {}
+        self._users: Dict[str, float] = {}
+
+    async def add_token(self, jti: str, expires_at: float) -> None:
+        self._tokens[jti] = expires_at
+
+    async def has_token(self, jti: str) -> bool:
+        return self._tokens.get(jti, 0) > time.time()
+
+    async def set_user(self, subject: str, not_before: float) -> None:
+        self._users[subject] = not_before
+
+    async def load(self, horizon: float) -> Tuple[List[str], Dict[str, float]]:
+        now: float = time.time()
+
+        self._tokens = {jti: exp for jti, exp in self._tokens.items() if exp > now}
+        self._users = {sub: ts for sub, ts in self._users.items() if ts > now - horizon}
+
+        return list(self._tokens), dict(self._users)
+
+
+class RedisRevocationStore:
+    def __init__(self, client: Redis, prefix: str = 'revoked') -> None:
+        self.client: Redis = client
+        self.tokens_key: str = f'{prefix}:jti'
+        self.users_key: str = f'{prefix}:user'
+
+    async def add_token(self, jti: str, expires_at: float) -> None:
+        await self.client.zadd(self.tokens_key, {jti: expires_at})
+
+    async def has_token(self, jti: str) -> bool:
+        score: Optional[float] = await self.client.zscore(self.tokens_key, jti)
+
+        return score is not None and score > time.time()
+
+    async def set_user(self, subject: str, not_before: float) -> None:
+        await self.client.hset(self.users_key, subject, not_before)
+
+    async def load(self, horizon: float) -> Tuple[List[str], Dict[str, float]]:
+        now: float = time.time()
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(self.tokens_key, '-inf', now)
+            pipe.zrange(self.tokens_key, 0, -1)
+            pipe.hgetall(self.users_key)
+            _, tokens, users = await pipe.execute()
+
+        stale: List[Any] = [sub for sub, ts in users.items() if float(ts) <= now - horizon]
+
+        if stale:
+            await self.client.hdel(self.users_key, *stale)
+
+        return (
+            [jti.decode() if isinstance(jti, bytes) else jti for jti in tokens],
+            {
+                (sub.decode() if isinstance(sub, bytes) else sub): float(ts)
+                for sub, ts in users.items()
+                if float(ts) > now - horizon
+            }
+        )
+
+
+class RevocationList:
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        horizon: float,
+    ) -> None:
+        self.capacity: int = capacity
+        self.error_rate: float = error_rate
+        self.horizon: float = horizon
+        self.memory_store: MemoryRevocationStore = MemoryRevocationStore()
+
+        self.bloom: BloomFilter = BloomFilter(capacity, error_rate)
+        self.users: Dict[str, float] = {}
+
+        self._recent: List[str] = []
+
+    def add_token(self, jti: str) -> None:
+        self.bloom.add(jti)
+        self._recent.append(jti)
+
+    @property
+    def store(self) -> MemoryRevocationStore | RedisRevocationStore:
+        if redis_helper.client is not None:
+            return RedisRevocationStore(redis_helper.client)
+
+        return self.memory_store
+
+    async def sync(self) -> None:
+        self._recent = []
+
+        tokens, users = await self.store.load(self.horizon)
+        bloom: BloomFilter = BloomFilter(max(self.capacity, len(tokens) * 2), self.error_rate)
+
+        for jti in tokens + self._recent:
+            bloom.add(jti)
+
+        for subject, not_before in self.users.items():
+            if not_before > users.get(subject, 0) and not_before > time.time() - self.horizon:
+                users[subject] = not_before
+
+        self.bloom = bloom
+        self.users = users
+
+    async def run(self, interval: float) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception:
+                logger.warning('Revocation list sync failed', exc_info=True)
+
+            await asyncio.sleep(interval)
+
+
+revocation_list: RevocationList = RevocationList(
+    capacity=app.revocation.bloom_capacity,
+    error_rate=app.revocation.bloom_error_rate,
+    horizon=max(app.jwt.access_token_ttl, app.jwt.refresh_token_ttl).total_seconds(),
+)
+
+
+class RevocationService:
+    @staticmethod
+    async def revoke_token(
+        jti: str,
+        expires_at: float
+    ) -> None:
+        await revocation_list.store.add_token(jti, expires_at)
+
+        revocation_list.add_token(jti)
+
+    @staticmethod
+    async def revoke_user(
+        subject: str
+    ) -> None:
+        not_before: float = time.time()
+
+        await revocation_list.store.set_user(subject, not_before)
+
+        revocation_list.users[subject] = not_before
+
+    @staticmethod
+    def issued_at_ms(
+        payload: Dict[str, Any]
+    ) -> int:
+        if 'iat_ms' in payload:
+            return int(payload['iat_ms'])
+
+        return int(payload.get('iat', 0)) * 1000
+
+    @staticmethod
+    async def is_revoked(
+        payload: Dict[str, Any]
+    ) -> bool:
+        not_before: Optional[float] = revocation_list.users.get(payload.get('sub'))
+
+        if not_before is not None and RevocationService.issued_at_ms(payload) < int(not_before * 1000):
+            return True
+
+        jti: Optional[str] = payload.get('jti')
+
+        if jti is None or jti not in revocation_list.bloom:
+            return False
+
+        return await revocation_list.store.has_token(jti)
+
+    @staticmethod
+    async def sync() -> None:
+        await revocation_list.sync()
+
+    @staticmethod
+    async def run_sync() -> None:
+        await revocation_list.run(app.revocation.sync_interval.total_seconds())
@@ -1,6 +1,6 @@
 from typing import Annotated, Optional
 from annotated_types import MinLen, MaxLen
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 
 class UserFirstNameUpdate(BaseModel):
@@ -11,4 +11,16 @@ class UserLastNameUpdate(BaseModel):
 
 class UserPasswordUpdate(BaseModel):
     current_password: Annotated[str, MinLen(5)]
-    new_password: Annotated[str, MinLen(5)]
\ No newline at end of file
+    new_password: Annotated[str, MinLen(5)]
+
+class UserUpdate(BaseModel):
+    first_name: Optional[Annotated[str, MinLen(3), MaxLen(64)]] = Field(default=None)
+    last_name: Optional[Annotated[str, MinLen(3), MaxLen(64)]] = Field(default=None)
+
+    @field_validator('first_name')
+    @classmethod
+    def first_name_not_null(cls, first_name: Optional[str]) -> str:
+        if first_name is None:
+            raise ValueError('first_name cannot be null')
+
+        return first_name
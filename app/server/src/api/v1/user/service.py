@@ -1,4 +1,5 @@
 from http import HTTPStatus
+from typing import Optional
 
 from fastapi import HTTPException
 
@@ -17,7 +18,20 @@ class UserService:
         password_update: UserPasswordUpdate,
         user: User
     ) -> User:
-        if not HashService().validate(
+        user: Optional[User] = await CRUDService().get_user_by_id(
+            session=session,
+            user_id=user.id
+        )
+
+        await session.commit()
+
+        if user is None:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND.value,
+                detail=[{'msg': 'User not found'}]
+            )
+
+        if not await HashService().avalidate(
             password=password_update.current_password,
             hashed_password=user.hashed_password
         ):
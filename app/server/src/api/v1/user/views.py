@@ -1,15 +1,16 @@
 from http import HTTPStatus
-from typing import Annotated
+from typing import Annotated, Dict, Any, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.v1.services import CRUDService
 from src.api.v1.service import Service
-from src.api.v1.schemas import UserBase
+from src.api.v1.schemas import Principal, UserBase
 from src.database import User, db_helper
+from src.responses import APIResponse
 
-from .schemas import UserPasswordUpdate, UserFirstNameUpdate, UserLastNameUpdate
+from .schemas import UserPasswordUpdate, UserFirstNameUpdate, UserLastNameUpdate, UserUpdate
 from .service import UserService
 
 
@@ -18,7 +19,8 @@ router: APIRouter = APIRouter()
 @router.post(
     path='/change-password',
     status_code=HTTPStatus.OK,
-    response_model=UserBase
+    response_model=UserBase,
+    dependencies=[Depends(Service().throttle_password_change)]
 )
 async def change_password_handler(
     current_user: Annotated[User, Depends(Service().get_current_user)],
@@ -27,14 +29,14 @@ async def change_password_handler(
         Depends(db_helper.session_getter),
     ],
     password_update: Annotated[UserPasswordUpdate, Query()]
-) -> User:
+) -> APIResponse:
     user: User = await UserService().change_password(
         session=session,
         password_update=password_update,
         user=current_user
     )
 
-    return user
+    return APIResponse(content=UserBase.model_validate(user))
 
 @router.post(
     path='/change-first-name',
@@ -42,38 +44,82 @@ async def change_password_handler(
     response_model=UserBase
 )
 async def change_first_name_handler(
-    current_user: Annotated[User, Depends(Service().get_current_user)],
+    principal: Annotated[Principal, Depends(Service().get_principal)],
     session: Annotated[
         AsyncSession,
         Depends(db_helper.session_getter),
     ],
     first_name_update: Annotated[UserFirstNameUpdate, Query()]
-) -> User:
-    user: User = await CRUDService().change_first_name(
+) -> APIResponse:
+    user: Optional[User] = await CRUDService().change_first_name(
         session=session,
-        user=current_user,
+        user_id=principal.id,
         first_name=first_name_update.first_name,
     )
 
-    return user
+    if user is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND.value,
+            detail=[{'msg': 'User not found'}]
+        )
+
+    return APIResponse(content=UserBase.model_validate(user))
 
 @router.post(
     path='/change-last-name',
     status_code=HTTPStatus.OK,
     response_model=UserBase
 )
-async def change_first_name_handler(
-    current_user: Annotated[User, Depends(Service().get_current_user)],
+async def change_last_name_handler(
+    principal: Annotated[Principal, Depends(Service().get_principal)],
     session: Annotated[
         AsyncSession,
         Depends(db_helper.session_getter),
     ],
     last_name_update: Annotated[UserLastNameUpdate, Query()]
-) -> User:
-    user: User = await CRUDService().change_last_name(
+) -> APIResponse:
+    user: Optional[User] = await CRUDService().change_last_name(
         session=session,
-        user=current_user,
-        first_name=last_name_update.last_name,
+        user_id=principal.id,
+        last_name=last_name_update.last_name,
     )
 
-    return user
\ No newline at end of file
+    if user is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND.value,
+            detail=[{'msg': 'User not found'}]
+        )
+
+    return APIResponse(content=UserBase.model_validate(user))
+
+@router.patch(
+    path='/me',
+    status_code=HTTPStatus.OK,
+    response_model=UserBase
+)
+async def update_me_handler(
+    current_user: Annotated[User, Depends(Service().get_current_user)],
+    session: Annotated[
+        AsyncSession,
+        Depends(db_helper.session_getter),
+    ],
+    user_update: UserUpdate
+) -> APIResponse:
+    values: Dict[str, Any] = user_update.model_dump(exclude_unset=True)
+
+    if not values:
+        return APIResponse(content=UserBase.model_validate(current_user))
+
+    user: Optional[User] = await CRUDService().update_user(
+        session=session,
+        user_id=current_user.id,
+        values=values
+    )
+
+    if user is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND.value,
+            detail=[{'msg': 'User not found'}]
+        )
+
+    return APIResponse(content=UserBase.model_validate(user))
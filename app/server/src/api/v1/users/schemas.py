@@ -0,0 +1,24 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.api.v1.schemas import UserBase
+
+
+class ImportRowError(BaseModel):
+    line: int
+    msg: str
+
+class ImportBatchReport(BaseModel):
+    batch: int
+    received: int
+    inserted: int = Field(default=0)
+    updated: int = Field(default=0)
+    conflicts: List[str] = Field(default=[])
+    duplicates: List[ImportRowError] = Field(default=[])
+    errors: List[ImportRowError] = Field(default=[])
+    failed: Optional[str] = Field(default=None)
+
+class UserPage(BaseModel):
+    items: List[UserBase]
+    next_after_id: Optional[int] = Field(default=None)
@@ -0,0 +1,428 @@
+import asyncio
+import codecs
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import Select, func, or_, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .schemas import ImportBatchReport, ImportRowError, UserPage
+
+from src.api.v1.auth.schemas import UserCreate
+from src.api.v1.schemas import UserBase, users_adapter
+from src.api.v1.services.cache import principal_cache
+from src.api.v1.services.hash import Hasher, HashService, hashers
+from src.api.v1.services.revocation import RevocationService
+from src.database import User, db_helper
+
+
+ImportFormat = Literal['csv', 'ndjson']
+ExportFormat = Literal['csv', 'ndjson']
+ConflictMode = Literal['skip', 'update']
+
+Record = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+IMPORT_COLUMNS: List[str] = ['first_name', 'last_name', 'email', 'hashed_password']
+EXPORT_COLUMNS: List[str] = list(UserBase.model_fields)
+TRIGRAM_MIN_LENGTH: int = 3
+
+
+class UserImportService:
+    @staticmethod
+    async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder('utf-8')()
+        buffer: str = ''
+
+        async for chunk in chunks:
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split('\n')
+
+            for line in lines:
+                yield line
+
+        buffer += decoder.decode(b'', final=True)
+
+        if buffer:
+            yield buffer
+
+    @staticmethod
+    async def iter_csv_rows(
+        lines: AsyncIterator[str]
+    ) -> AsyncIterator[Tuple[int, Optional[List[str]]]]:
+        line_no: int = 0
+        pending: List[str] = []
+        quotes: int = 0
+
+        async for line in lines:
+            line_no += 1
+            pending.append(line + '\n')
+            quotes += line.count('"')
+
+            if quotes % 2:
+                continue
+
+            start: int = line_no - len(pending) + 1
+            record: List[str] = pending
+            pending, quotes = [], 0
+
+            if ''.join(record).strip():
+                yield start, next(csv.reader(record))
+
+        if pending:
+            yield line_no - len(pending) + 1, None
+
+    @staticmethod
+    async def iter_records(
+        lines: AsyncIterator[str],
+        format: ImportFormat
+    ) -> AsyncIterator[Record]:
+        if format == 'ndjson':
+            line_no: int = 0
+
+            async for line in lines:
+                line_no += 1
+
+                if not line.strip():
+                    continue
+
+                try:
+                    data: Any = json.loads(line)
+                except ValueError as error:
+                    yield line_no, None, f'Invalid JSON: {error}'
+                    continue
+
+                if not isinstance(data, dict):
+                    yield line_no, None, 'Expected a JSON object'
+                    continue
+
+                yield line_no, data, None
+
+            return
+
+        header: Optional[List[str]] = None
+
+        async for line_no, values in UserImportService.iter_csv_rows(lines):
+            if values is None:
+                yield line_no, None, 'Unterminated quoted field'
+                continue
+
+            if header is None:
+                header = [value.strip() for value in values]
+                continue
+
+            if len(values) != len(header):
+                yield line_no, None, f'Expected {len(header)} columns, got {len(values)}'
+                continue
+
+            yield line_no, {
+                key: value if value != '' else None
+                for key, value in zip(header, values)
+            }, None
+
+    @staticmethod
+    async def iter_batches(
+        records: AsyncIterator[Record],
+        batch_size: int
+    ) -> AsyncIterator[List[Record]]:
+        batch: List[Record] = []
+
+        async for record in records:
+            batch.append(record)
+
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    def validate(
+        line: int,
+        data: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[ImportRowError]]:
+        data = dict(data)
+        hashed_password: Optional[str] = data.pop('hashed_password', None)
+        password: Optional[str] = data.pop('password', None)
+
+        if password is None and hashed_password is None:
+            return None, ImportRowError(line=line, msg='password: Field required')
+
+        if hashed_password is not None:
+            hasher: Optional[Hasher] = hashers.identify(hashed_password)
+
+            if hasher is None:
+                return None, ImportRowError(line=line, msg='Unsupported password hash format')
+
+            if not hasher.is_valid(hashed_password):
+                return None, ImportRowError(line=line, msg=f'Malformed {hasher.name} password hash')
+
+            password = hashed_password
+
+        try:
+            user: UserCreate = UserCreate.model_validate({**data, 'hashed_password': password})
+        except ValidationError as error:
+            return None, ImportRowError(
+                line=line,
+                msg='; '.join(
+                    f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}"
+                    for item in error.errors()
+                )
+            )
+
+        values: Dict[str, Any] = user.model_dump()
+        values['hashed'] = hashed_password is not None
+
+        return values, None
+
+    @staticmethod
+    async def copy_batch(
+        session: AsyncSession,
+        rows: List[Dict[str, Any]],
+        on_conflict: ConflictMode
+    ) -> List[Tuple[str, bool]]:
+        await session.execute(text(
+            'CREATE TEMP TABLE users_import ('
+            'first_name VARCHAR(64), last_name VARCHAR(64), email VARCHAR, hashed_password VARCHAR'
+            ') ON COMMIT DROP'
+        ))
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+
+        await raw_connection.driver_connection.copy_records_to_table(
+            'users_import',
+            records=[tuple(row[column] for column in IMPORT_COLUMNS) for row in rows],
+            columns=IMPORT_COLUMNS,
+        )
+
+        conflict_clause: str = (
+            'DO NOTHING'
+            if on_conflict == 'skip'
+            else 'DO UPDATE SET first_name = EXCLUDED.first_name, last_name = EXCLUDED.last_name, '
+                 'hashed_password = EXCLUDED.hashed_password, token_version = users.token_version + 1, '
+                 'last_updated_at = now()'
+        )
+        result = await session.execute(text(
+            'INSERT INTO users (first_name, last_name, email, hashed_password) '
+            'SELECT DISTINCT ON (lower(email)) first_name, last_name, email, hashed_password '
+            'FROM users_import ORDER BY lower(email) '
+            f'ON CONFLICT (lower(email)) {conflict_clause} '
+            'RETURNING email, (xmax = 0) AS inserted'
+        ))
+
+        return [(row.email, row.inserted) for row in result]
+
+    @staticmethod
+    async def import_batch(
+        number: int,
+        batch: List[Record],
+        workers: int,
+        on_conflict: ConflictMode
+    ) -> ImportBatchReport:
+        report: ImportBatchReport = ImportBatchReport(
+            batch=number,
+            received=len(batch)
+        )
+        rows: List[Dict[str, Any]] = []
+        seen: Dict[str, int] = {}
+
+        for line, data, error in batch:
+            if error is not None:
+                report.errors.append(ImportRowError(line=line, msg=error))
+                continue
+
+            values, row_error = UserImportService.validate(line, data)
+
+            if row_error is not None:
+                report.errors.append(row_error)
+                continue
+
+            email: str = values['email'].lower()
+
+            if email in seen:
+                report.duplicates.append(ImportRowError(
+                    line=line,
+                    msg=f'Duplicate email, first seen on line {seen[email]}'
+                ))
+                continue
+
+            seen[email] = line
+            rows.append(values)
+
+        if not rows:
+            return report
+
+        plain: List[Dict[str, Any]] = [row for row in rows if not row['hashed']]
+        hashed: List[str] = await HashService().ahash_many(
+            (row['hashed_password'] for row in plain),
+            concurrency=workers
+        )
+
+        for row, hashed_password in zip(plain, hashed):
+            row['hashed_password'] = hashed_password
+
+        try:
+            async with db_helper.session_factory() as session:
+                written: List[Tuple[str, bool]] = await UserImportService.copy_batch(
+                    session=session,
+                    rows=rows,
+                    on_conflict=on_conflict
+                )
+
+                await session.commit()
+        except SQLAlchemyError as error:
+            report.failed = str(error.__cause__ or error)
+
+            return report
+
+        written_emails = {email.lower() for email, _ in written}
+
+        report.inserted = sum(1 for _, inserted in written if inserted)
+        report.updated = len(written) - report.inserted
+        report.conflicts = sorted({
+            row['email'] for row in rows
+            if row['email'].lower() not in written_emails
+        })
+
+        updated: List[str] = [email for email, inserted in written if not inserted]
+
+        for email in updated:
+            principal_cache.invalidate(email)
+
+        await asyncio.gather(*(
+            RevocationService().revoke_user(subject=email)
+            for email in updated
+        ))
+
+        return report
+
+    @staticmethod
+    async def run(
+        lines: AsyncIterator[str],
+        format: ImportFormat = 'csv',
+        batch_size: int = 5000,
+        workers: Optional[int] = None,
+        on_conflict: ConflictMode = 'skip'
+    ) -> AsyncIterator[ImportBatchReport]:
+        workers = min(workers or HashService().max_workers(), HashService().max_workers())
+        number: int = 0
+
+        async for batch in UserImportService.iter_batches(
+            UserImportService.iter_records(lines, format),
+            batch_size
+        ):
+            number += 1
+
+            yield await UserImportService.import_batch(
+                number=number,
+                batch=batch,
+                workers=workers,
+                on_conflict=on_conflict
+            )
+
+
+class UserListService:
+    @staticmethod
+    def select_users(after_id: Optional[int]) -> Select:
+        statement: Select = (
+            Select(*(getattr(User, column) for column in EXPORT_COLUMNS))
+            .order_by(User.id)
+        )
+
+        if after_id is not None:
+            statement = statement.where(User.id > after_id)
+
+        return statement
+
+    @staticmethod
+    async def list_users(
+        session: AsyncSession,
+        after_id: Optional[int],
+        limit: int
+    ) -> UserPage:
+        result = await session.execute(
+            UserListService.select_users(after_id).limit(limit + 1)
+        )
+        items: List[UserBase] = users_adapter.validate_python(result.all())
+
+        await session.commit()
+
+        if len(items) <= limit:
+            return UserPage(items=items)
+
+        return UserPage(
+            items=items[:limit],
+            next_after_id=items[limit - 1].id
+        )
+
+    @staticmethod
+    def escape_like(value: str) -> str:
+        return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+    @staticmethod
+    async def search_users(
+        session: AsyncSession,
+        query: str,
+        limit: int
+    ) -> List[UserBase]:
+        query = query.strip().lower()
+        pattern: str = UserListService.escape_like(query)
+        conditions: List[Any] = [
+            func.lower(User.email).like(f'{pattern}%', escape='\\')
+        ]
+
+        if len(query) >= TRIGRAM_MIN_LENGTH:
+            conditions.extend([
+                User.first_name.ilike(f'%{pattern}%', escape='\\'),
+                User.last_name.ilike(f'%{pattern}%', escape='\\')
+            ])
+
+        result = await session.execute(
+            UserListService.select_users(None)
+            .where(or_(*conditions))
+            .order_by(None)
+            .limit(limit)
+        )
+        users: List[UserBase] = users_adapter.validate_python(result.all())
+
+        await session.commit()
+
+        return users
+
+    @staticmethod
+    async def export_users(
+        format: ExportFormat,
+        after_id: Optional[int] = None,
+        chunk_size: int = 1000
+    ) -> AsyncIterator[str | bytes]:
+        async with db_helper.read_session_factory() as session:
+            result = await session.stream(
+                UserListService.select_users(after_id)
+                .execution_options(yield_per=chunk_size)
+            )
+
+            if format == 'csv':
+                yield ','.join(EXPORT_COLUMNS) + '\r\n'
+
+            async for rows in result.partitions():
+                users: List[UserBase] = users_adapter.validate_python(rows)
+
+                if format == 'ndjson':
+                    yield b''.join(
+                        UserBase.__pydantic_serializer__.to_json(user) + b'\n'
+                        for user in users
+                    )
+                    continue
+
+                buffer: io.StringIO = io.StringIO()
+                writer = csv.writer(buffer)
+
+                for user in users:
+                    writer.writerow(user.model_dump(mode='json').values())
+
+                yield buffer.getvalue()
@@ -0,0 +1,123 @@
+from typing import Annotated, AsyncIterator, List, Optional
+
+from annotated_types import MinLen, MaxLen
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .schemas import ImportBatchReport, UserPage
+from .service import UserImportService, UserListService, ImportFormat, ExportFormat, ConflictMode
+
+from src.api.v1.schemas import UserBase, users_adapter
+from src.api.v1.service import Service
+from src.api.v1.services.hash import HashService
+from src.database import db_helper
+from src.responses import APIResponse
+
+
+# StreamingResponse.__call__ from Starlette 0.46 minus the listen_for_disconnect
+# task it runs for ASGI < 2.4. That task reads receive(), which would consume the
+# request body the import is still streaming; a disconnect surfaces as OSError instead.
+class ImportResponse(StreamingResponse):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+
+        if self.background is not None:
+            await self.background()
+
+
+router: APIRouter = APIRouter(
+    dependencies=[Depends(Service().get_current_admin)]
+)
+
+@router.get(
+    path='',
+    response_model=UserPage
+)
+async def list_handler(
+    session: Annotated[
+        AsyncSession,
+        Depends(db_helper.read_session_getter),
+    ],
+    after_id: Annotated[Optional[int], Query(ge=0)] = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100
+) -> APIResponse:
+    return APIResponse(
+        content=await UserListService().list_users(
+            session=session,
+            after_id=after_id,
+            limit=limit
+        )
+    )
+
+@router.get(
+    path='/search',
+    response_model=List[UserBase]
+)
+async def search_handler(
+    session: Annotated[
+        AsyncSession,
+        Depends(db_helper.read_session_getter),
+    ],
+    q: Annotated[str, Query(), MinLen(1), MaxLen(128)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20
+) -> APIResponse:
+    return APIResponse(
+        content=await UserListService().search_users(
+            session=session,
+            query=q,
+            limit=limit
+        ),
+        adapter=users_adapter
+    )
+
+@router.get(
+    path='/export',
+    response_class=StreamingResponse,
+    responses={200: {'content': {'application/x-ndjson': {}, 'text/csv': {}}}}
+)
+async def export_handler(
+    format: Annotated[ExportFormat, Query()] = 'ndjson',
+    after_id: Annotated[Optional[int], Query(ge=0)] = None
+) -> StreamingResponse:
+    return StreamingResponse(
+        content=UserListService().export_users(
+            format=format,
+            after_id=after_id
+        ),
+        media_type='application/x-ndjson' if format == 'ndjson' else 'text/csv',
+        headers={'Content-Disposition': f'attachment; filename="users.{format}"'}
+    )
+
+@router.post(
+    path='/import',
+    response_class=ImportResponse,
+    responses={200: {'content': {'application/x-ndjson': {}}, 'model': ImportBatchReport}}
+)
+async def import_handler(
+    request: Request,
+    format: Annotated[ImportFormat, Query()] = 'csv',
+    batch_size: Annotated[int, Query(ge=1, le=50_000)] = 5000,
+    workers: Annotated[Optional[int], Query(ge=1, le=HashService().max_workers())] = None,
+    on_conflict: Annotated[ConflictMode, Query()] = 'skip'
+) -> ImportResponse:
+    async def reports() -> AsyncIterator[str]:
+        async for report in UserImportService().run(
+            lines=UserImportService().iter_lines(request.stream()),
+            format=format,
+            batch_size=batch_size,
+            workers=workers,
+            on_conflict=on_conflict
+        ):
+            yield report.model_dump_json() + '\n'
+
+    return ImportResponse(
+        content=reports(),
+        media_type='application/x-ndjson'
+    )
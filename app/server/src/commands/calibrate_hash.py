@@ -0,0 +1,76 @@
+import argparse
+import statistics
+import time
+from typing import Callable, Iterator, Tuple
+
+from src.api.v1.services.hash.hashers import (
+    Argon2Hasher,
+    BCryptHasher,
+    Hasher,
+    ScryptHasher,
+)
+from src.config import app
+
+
+def candidates(algorithm: str) -> Iterator[Tuple[str, Callable[[], Hasher]]]:
+    if algorithm == 'bcrypt':
+        for rounds in range(4, 32):
+            yield f'CONFIG__HASH__BCRYPT_ROUNDS={rounds}', lambda rounds=rounds: BCryptHasher(rounds=rounds)
+
+    elif algorithm == 'scrypt':
+        for ln in range(10, 25):
+            yield f'CONFIG__HASH__SCRYPT_N={2 ** ln}', lambda ln=ln: ScryptHasher(
+                n=2 ** ln,
+                r=app.hash.scrypt_r,
+                p=app.hash.scrypt_p,
+            )
+
+    elif algorithm == 'argon2':
+        for time_cost in range(1, 33):
+            yield f'CONFIG__HASH__ARGON2_TIME_COST={time_cost}', lambda time_cost=time_cost: Argon2Hasher(
+                time_cost=time_cost,
+                memory_cost=app.hash.argon2_memory_cost,
+                parallelism=app.hash.argon2_parallelism,
+            )
+
+
+def measure(hasher: Hasher, samples: int) -> float:
+    timings = []
+
+    for _ in range(samples):
+        started: float = time.perf_counter()
+        hasher.hash('calibration-password')
+        timings.append(time.perf_counter() - started)
+
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Pick the highest hash cost that stays within a target latency on this machine.'
+    )
+    parser.add_argument('--algorithm', default=app.hash.algorithm, choices=['bcrypt', 'scrypt', 'argon2'])
+    parser.add_argument('--target-ms', type=float, default=250.0)
+    parser.add_argument('--samples', type=int, default=3)
+    args = parser.parse_args()
+
+    chosen = None
+
+    for setting, factory in candidates(args.algorithm):
+        elapsed: float = measure(factory(), args.samples)
+        print(f'{setting:<40} {elapsed:>10.1f} ms')
+
+        if elapsed > args.target_ms:
+            break
+
+        chosen = setting
+
+    if chosen is None:
+        print(f'No {args.algorithm} cost meets {args.target_ms} ms on this machine')
+        return
+
+    print(chosen)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+import argparse
+from pathlib import Path
+
+from src.config import app
+from src.server import Server
+from src.server.openapi import OpenAPIDocument
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Build the OpenAPI document once and write it to disk for serving at startup.'
+    )
+    parser.add_argument('--output', type=Path, default=app.swagger.openapi_file or Path('openapi.json'))
+    args = parser.parse_args()
+
+    document: OpenAPIDocument = OpenAPIDocument(application=Server()())
+    document.dump(args.output)
+
+    print(f'OpenAPI document written to {args.output} ({document.etag})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import argparse
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+from src.config import app
+
+
+def generate_private_key(algorithm: str):
+    if algorithm == 'RS256':
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    if algorithm == 'ES256':
+        return ec.generate_private_key(ec.SECP256R1())
+
+    if algorithm == 'EdDSA':
+        return ed25519.Ed25519PrivateKey.generate()
+
+    raise ValueError(f'Unsupported algorithm: {algorithm}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Generate a JWT signing key pair for the configured algorithm.'
+    )
+    parser.add_argument('--algorithm', default=app.jwt.algorithm, choices=['RS256', 'ES256', 'EdDSA'])
+    parser.add_argument('--private-key', type=Path, default=app.jwt.private_key)
+    parser.add_argument('--public-key', type=Path, default=app.jwt.public_key)
+    args = parser.parse_args()
+
+    private_key = generate_private_key(args.algorithm)
+
+    args.private_key.write_bytes(private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ))
+    args.public_key.write_bytes(private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ))
+
+    print(f'{args.algorithm} key pair written to {args.private_key} and {args.public_key}')
+
+
+if __name__ == '__main__':
+    main()
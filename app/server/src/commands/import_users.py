@@ -0,0 +1,59 @@
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+from src.api.v1.users.service import UserImportService
+from src.database import db_helper
+
+
+async def read_lines(path: Path) -> AsyncIterator[str]:
+    with sys.stdin if str(path) == '-' else path.open(encoding='utf-8') as file:
+        for line in file:
+            yield line.rstrip('\n')
+
+
+async def run(args: argparse.Namespace) -> int:
+    started: float = time.perf_counter()
+    inserted: int = 0
+    failed_rows: int = 0
+
+    async for report in UserImportService().run(
+        lines=read_lines(args.path),
+        format=args.format,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        on_conflict=args.on_conflict
+    ):
+        inserted += report.inserted + report.updated
+        failed_rows += len(report.errors) + len(report.conflicts) + len(report.duplicates)
+        print(report.model_dump_json(), flush=True)
+
+    await db_helper.dispose()
+
+    elapsed: float = time.perf_counter() - started
+    print(
+        f'{inserted} users written, {failed_rows} rows rejected in {elapsed:.1f}s '
+        f'({inserted / elapsed if elapsed else 0:.0f} users/s)',
+        file=sys.stderr
+    )
+
+    return 0 if failed_rows == 0 else 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Bulk import users from CSV or NDJSON.')
+    parser.add_argument('path', type=Path, help='Input file, or - for stdin')
+    parser.add_argument('--format', choices=['csv', 'ndjson'], default='csv')
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--on-conflict', choices=['skip', 'update'], default='skip')
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == '__main__':
+    main()
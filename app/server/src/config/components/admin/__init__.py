@@ -0,0 +1,10 @@
+from typing import List
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class AdminConfig(BaseSettings):
+    emails: List[str] = Field(default=[])
+
+__all__ = ['AdminConfig']
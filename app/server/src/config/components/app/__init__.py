@@ -4,8 +4,16 @@ from pydantic_settings import BaseSettings
 from src.config.constants import ENV_FILE_PATH
 
 from src.config.components.jwt import JWTConfig
+from src.config.components.admin import AdminConfig
+from src.config.components.hash import HashConfig
 from src.config.components.cors import CORSConfig
+from src.config.components.cache import CacheConfig
 from src.config.components.redis import RedisConfig
+from src.config.components.ratelimit import RateLimitConfig
+from src.config.components.revocation import RevocationConfig
+from src.config.components.metrics import MetricsConfig
+from src.config.components.profiler import ProfilerConfig
+from src.config.components.server import ServerConfig
 from src.config.components.swagger import SwaggerConfig
 from src.config.components.database import DatabaseConfig
 
@@ -18,10 +26,19 @@ class ApplicationConfig(BaseSettings):
 
     host: str = Field(default='0.0.0.0')
     port: int = Field(default=8000)
+    lazy_startup: bool = Field(default=False)
 
     jwt: JWTConfig = JWTConfig()
+    admin: AdminConfig = AdminConfig()
+    hash: HashConfig = HashConfig()
     cors: CORSConfig = CORSConfig()
+    cache: CacheConfig = CacheConfig()
     redis: RedisConfig = RedisConfig()
+    rate_limit: RateLimitConfig = RateLimitConfig()
+    revocation: RevocationConfig = RevocationConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    profiler: ProfilerConfig = ProfilerConfig()
+    server: ServerConfig = ServerConfig()
     swagger: SwaggerConfig = SwaggerConfig()
     database: DatabaseConfig = DatabaseConfig()
 
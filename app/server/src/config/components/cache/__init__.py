@@ -0,0 +1,13 @@
+from datetime import timedelta
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class CacheConfig(BaseSettings):
+    principal_size: int = Field(default=10_000, ge=0)
+    principal_ttl: timedelta = Field(default=timedelta(seconds=60))
+    token_size: int = Field(default=10_000, ge=0)
+    token_ttl: timedelta = Field(default=timedelta(minutes=5))
+
+__all__ = ['CacheConfig']
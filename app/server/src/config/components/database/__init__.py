@@ -1,4 +1,5 @@
-from typing import Dict
+from datetime import timedelta
+from typing import Dict, List, Optional
 
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings
@@ -16,6 +17,15 @@ class DatabaseConfig(BaseSettings):
     echo_pool: bool = Field(default=False)
     pool_size: int = Field(default=5)
     max_overflow: int = Field(default=10)
+    max_connections: Optional[int] = Field(default=100, ge=1)
+    pool_pre_ping: bool = Field(default=False)
+    pool_recycle: Optional[timedelta] = Field(default=None)
+    statement_cache_size: int = Field(default=100, ge=0)
+    pgbouncer: bool = Field(default=False)
+    warm_up: bool = Field(default=False)
+
+    replicas: List[str] = Field(default_factory=list)
+    replica_check_interval: timedelta = Field(default=timedelta(seconds=5))
 
     naming_convention: Dict[str, str] = Field(
         default= {
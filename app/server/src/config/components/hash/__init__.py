@@ -0,0 +1,22 @@
+from typing import Literal, Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class HashConfig(BaseSettings):
+    algorithm: Literal['bcrypt', 'scrypt', 'argon2'] = Field(default='bcrypt')
+    bcrypt_rounds: int = Field(default=12, ge=4, le=31)
+    scrypt_n: int = Field(default=2 ** 14, ge=2)
+    scrypt_r: int = Field(default=8, ge=1)
+    scrypt_p: int = Field(default=1, ge=1)
+    argon2_time_cost: int = Field(default=3, ge=1)
+    argon2_memory_cost: int = Field(default=65536, ge=8)
+    argon2_parallelism: int = Field(default=4, ge=1)
+
+    executor: Literal['thread', 'process'] = Field(default='thread')
+    max_workers: Optional[int] = Field(default=None, ge=1)
+    max_queue_depth: int = Field(default=64, ge=0)
+    retry_after: int = Field(default=1, ge=0)
+
+__all__ = ['HashConfig']
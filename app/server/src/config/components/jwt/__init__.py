@@ -1,5 +1,6 @@
 from datetime import timedelta
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -10,8 +11,9 @@ from src.config.constants import ROOT_DIR
 class JWTConfig(BaseSettings):
     private_key: Path = Field(default=ROOT_DIR / 'certs' / 'jwt-private.pem')
     public_key: Path = Field(default=ROOT_DIR / 'certs' / 'jwt-public.pem')
-    algorithm: str = Field(default='RS256')
+    algorithm: Literal['RS256', 'ES256', 'EdDSA'] = Field(default='RS256')
     access_token_ttl: timedelta = Field(default=timedelta(hours=1))
     refresh_token_ttl: timedelta = Field(default=timedelta(days=1))
+    embed_principal: bool = Field(default=False)
 
-__all__ = ['JWTConfig']
\ No newline at end of file
+__all__ = ['JWTConfig']
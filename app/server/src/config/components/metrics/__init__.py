@@ -0,0 +1,11 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class MetricsConfig(BaseSettings):
+    enabled: bool = Field(default=True)
+    endpoint: str = Field(default='/metrics')
+    server_timing: bool = Field(default=False)
+    max_queries: int = Field(default=10, ge=1)
+
+__all__ = ['MetricsConfig']
@@ -0,0 +1,15 @@
+from pathlib import Path
+from typing import Optional
+
+from pydantic import Field, SecretStr
+from pydantic_settings import BaseSettings
+
+
+class ProfilerConfig(BaseSettings):
+    enabled: bool = Field(default=True)
+    directory: Path = Field(default=Path('/tmp/profiles'))
+    max_profiles: int = Field(default=50, ge=1)
+    header: str = Field(default='X-Profile')
+    token: Optional[SecretStr] = Field(default=None)
+
+__all__ = ['ProfilerConfig']
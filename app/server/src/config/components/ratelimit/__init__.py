@@ -0,0 +1,14 @@
+from datetime import timedelta
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class RateLimitConfig(BaseSettings):
+    enabled: bool = Field(default=True)
+    window: timedelta = Field(default=timedelta(minutes=1))
+    ip_limit: int = Field(default=30, ge=1)
+    email_limit: int = Field(default=10, ge=1)
+    memory_max_keys: int = Field(default=100_000, ge=1)
+
+__all__ = ['RateLimitConfig']
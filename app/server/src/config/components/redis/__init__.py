@@ -5,12 +5,14 @@ from pydantic_settings import BaseSettings
 
 
 class RedisConfig(BaseSettings):
+    enabled: bool = Field(default=False)
     host: str = Field(default='localhost')
     port: int | str = Field(default=6379)
     password: Optional[str] = Field(default=None)
     username: Optional[str] = Field(default=None)
     decode_responses: bool = Field(default=True)
     db: int = Field(default=0)
+    socket_timeout: float = Field(default=0.5)
 
 
 __all__ = ['RedisConfig']
\ No newline at end of file
@@ -0,0 +1,12 @@
+from datetime import timedelta
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class RevocationConfig(BaseSettings):
+    sync_interval: timedelta = Field(default=timedelta(seconds=5))
+    bloom_capacity: int = Field(default=100_000, ge=1)
+    bloom_error_rate: float = Field(default=0.001, gt=0, lt=1)
+
+__all__ = ['RevocationConfig']
@@ -0,0 +1,17 @@
+from typing import Literal, Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ServerConfig(BaseSettings):
+    workers: Optional[int] = Field(default=None, ge=1)
+    loop: Literal['auto', 'asyncio', 'uvloop'] = Field(default='uvloop')
+    http: Literal['auto', 'h11', 'httptools'] = Field(default='httptools')
+    backlog: int = Field(default=2048, ge=1)
+    timeout_keep_alive: int = Field(default=5, ge=1)
+    limit_max_requests: Optional[int] = Field(default=None, ge=1)
+    proxy_headers: bool = Field(default=True)
+    forwarded_allow_ips: str = Field(default='127.0.0.1')
+
+__all__ = ['ServerConfig']
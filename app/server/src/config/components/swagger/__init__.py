@@ -1,3 +1,6 @@
+from pathlib import Path
+from typing import Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -10,7 +13,11 @@ class SwaggerConfig(BaseSettings):
     mount_path: str = Field(default='src/swagger/static')
     name: str = Field(default='static')
 
-    docs: DocsConfig = DocsConfig()
-    redoc: RedocConfig = RedocConfig()
+    openapi_enabled: bool = Field(default=True)
+    openapi_url: str = Field(default='/openapi.json')
+    openapi_file: Optional[Path] = Field(default=None)
+
+    docs: DocsConfig = Field(default_factory=DocsConfig)
+    redoc: RedocConfig = Field(default_factory=RedocConfig)
 
 __all__ = ['SwaggerConfig']
\ No newline at end of file
@@ -1,12 +1,13 @@
 from .helper import db_helper
 from .mixins import IntIdPkMixin
 from .base import Base
-from .models import User
+from .models import User, RefreshTokenFamily
 
 
 __all__ = [
     'db_helper',
     'IntIdPkMixin',
     'Base',
-    'User'
+    'User',
+    'RefreshTokenFamily'
 ]
\ No newline at end of file
@@ -1,14 +1,42 @@
-from typing import AsyncGenerator
+import asyncio
+import logging
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
 
 from pydantic import PostgresDsn
+from sqlalchemy import Executable, make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     create_async_engine,
     async_sessionmaker,
     AsyncSession
 )
 
+from .routing import Replica, ReplicaSet, RoutingSession
+
 from src.config import app
+from src.monitoring import InstrumentedQueuePool, instrument_engine
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def worker_pool_limits(
+    pool_size: int,
+    max_overflow: int,
+    max_connections: Optional[int],
+    workers: int
+) -> Tuple[int, int]:
+    if max_connections is None:
+        return pool_size, max_overflow
+
+    budget: int = max(max_connections // workers, 1)
+    pool_size = min(pool_size, budget)
+
+    return pool_size, max(min(max_overflow, budget - pool_size), 0)
 
 
 class DatabaseHelper:
@@ -19,28 +47,143 @@ class DatabaseHelper:
         echo_pool: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        pool_pre_ping: bool = False,
+        pool_recycle: Optional[timedelta] = None,
+        statement_cache_size: int = 100,
+        pgbouncer: bool = False,
+        replicas: Sequence[str] = (),
     ) -> None:
-        self.engine: AsyncEngine = create_async_engine(
+        self.url: str = url
+        self.replica_urls: List[str] = list(replicas)
+        self.echo: bool = echo
+        self.echo_pool: bool = echo_pool
+        self.pool_size: int = pool_size
+        self.max_overflow: int = max_overflow
+        self.pool_pre_ping: bool = pool_pre_ping
+        self.pool_recycle: Optional[timedelta] = pool_recycle
+        self.statement_cache_size: int = statement_cache_size
+        self.pgbouncer: bool = pgbouncer
+
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._replicas: Optional[ReplicaSet] = None
+        self._read_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+    def connect_args(self, url: str) -> Dict[str, Any]:
+        if make_url(url).get_driver_name() != 'asyncpg':
+            return {}
+
+        if self.pgbouncer:
+            return {
+                'statement_cache_size': 0,
+                'prepared_statement_cache_size': 0,
+                'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+            }
+
+        return {
+            'statement_cache_size': self.statement_cache_size,
+            'prepared_statement_cache_size': self.statement_cache_size,
+        }
+
+    def create_engine(self, url: str, name: str) -> AsyncEngine:
+        engine: AsyncEngine = create_async_engine(
             url=url,
-            echo=echo,
-            echo_pool=echo_pool,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-        )
-        self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
-            bind=self.engine,
-            autoflush=False,
-            autocommit=False,
-            expire_on_commit=False,
+            echo=self.echo,
+            echo_pool=self.echo_pool,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_pre_ping=self.pool_pre_ping,
+            pool_recycle=int(self.pool_recycle.total_seconds()) if self.pool_recycle else -1,
+            pool_logging_name=name,
+            poolclass=InstrumentedQueuePool,
+            connect_args=self.connect_args(url),
         )
+        instrument_engine(engine.sync_engine)
+
+        return engine
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = self.create_engine(self.url, 'primary')
+
+        return self._engine
+
+    @property
+    def replicas(self) -> ReplicaSet:
+        if self._replicas is None:
+            self._replicas = ReplicaSet([
+                Replica(name=f'replica-{index}', engine=self.create_engine(url, f'replica-{index}'))
+                for index, url in enumerate(self.replica_urls)
+            ])
+
+        return self._replicas
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            self._session_factory = async_sessionmaker(
+                bind=self.engine,
+                autoflush=False,
+                autocommit=False,
+                expire_on_commit=False,
+            )
+
+        return self._session_factory
+
+    @property
+    def read_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._read_session_factory is None:
+            self._read_session_factory = async_sessionmaker(
+                sync_session_class=RoutingSession,
+                primary=self.engine.sync_engine,
+                replicas=self.replicas,
+                autoflush=False,
+                autocommit=False,
+                expire_on_commit=False,
+            )
+
+        return self._read_session_factory
+
+    async def warm_up(self, statements: Sequence[Executable] = ()) -> None:
+        async def prepare(connection: AsyncConnection) -> None:
+            for statement in statements:
+                await connection.execute(statement)
+
+        try:
+            async with AsyncExitStack() as stack:
+                connections = await asyncio.gather(*(
+                    stack.enter_async_context(engine.connect())
+                    for engine in [self.engine, *(replica.engine for replica in self.replicas.replicas)]
+                    for _ in range(self.pool_size)
+                ))
+
+                await asyncio.gather(*(prepare(connection) for connection in connections))
+        except Exception:
+            logger.warning('Database pool warm-up failed', exc_info=True)
 
     async def dispose(self) -> None:
-        await self.engine.dispose()
+        if self._engine is not None:
+            await self._engine.dispose()
+
+        if self._replicas is not None:
+            await self._replicas.dispose()
 
     async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.session_factory() as session:
             yield session
 
+    async def read_session_getter(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self.read_session_factory() as session:
+            yield session
+
+
+pool_size, max_overflow = worker_pool_limits(
+    pool_size=app.database.pool_size,
+    max_overflow=app.database.max_overflow,
+    max_connections=app.database.max_connections,
+    workers=app.server.workers or 1
+)
 
 db_helper = DatabaseHelper(
     url=str(
@@ -49,6 +192,11 @@ db_helper = DatabaseHelper(
     ),
     echo=app.database.echo,
     echo_pool=app.database.echo_pool,
-    pool_size=app.database.pool_size,
-    max_overflow=app.database.max_overflow
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+    pool_pre_ping=app.database.pool_pre_ping,
+    pool_recycle=app.database.pool_recycle,
+    statement_cache_size=app.database.statement_cache_size,
+    pgbouncer=app.database.pgbouncer,
+    replicas=app.database.replicas
 )
\ No newline at end of file
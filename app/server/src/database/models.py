@@ -1,4 +1,4 @@
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, Integer, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import expression
 
@@ -27,10 +27,62 @@ class User(IntIdPkMixin,
     )
     email: Mapped[str] = mapped_column(
         String(),
-        nullable=False,
-        unique=True
+        nullable=False
     )
     hashed_password: Mapped[str] = mapped_column(
         String(),
         nullable=False
-    )
\ No newline at end of file
+    )
+    token_version: Mapped[int] = mapped_column(
+        Integer,
+        server_default='0',
+        nullable=False
+    )
+
+Index(
+    'ix_users_email_lower',
+    func.lower(User.email).label('email_lower'),
+    unique=True,
+    postgresql_ops={'email_lower': 'text_pattern_ops'}
+)
+Index(
+    'ix_users_first_name_trgm',
+    User.first_name,
+    postgresql_using='gin',
+    postgresql_ops={'first_name': 'gin_trgm_ops'}
+)
+Index(
+    'ix_users_last_name_trgm',
+    User.last_name,
+    postgresql_using='gin',
+    postgresql_ops={'last_name': 'gin_trgm_ops'}
+)
+
+class RefreshTokenFamily(CreatedAtPkMixin,
+                         LastUpdatedAtPkMixin,
+                         Base):
+    __tablename__ = 'refresh_token_families'
+
+    id: Mapped[str] = mapped_column(
+        String(32),
+        primary_key=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    current_jti: Mapped[str] = mapped_column(
+        String(32),
+        nullable=False
+    )
+    expires_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+    revoked: Mapped[bool] = mapped_column(
+        Boolean,
+        server_default=expression.false(),
+        nullable=False
+    )
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import Engine, event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+primary_pinned: ContextVar[bool] = ContextVar('primary_pinned', default=False)
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: AsyncEngine
+    healthy: bool = True
+    failures: int = 0
+    checked_at: float = 0.0
+
+
+class ReplicaSet:
+    def __init__(self, replicas: List[Replica]) -> None:
+        self.replicas: List[Replica] = replicas
+
+        self._counter: Iterator[int] = count()
+
+        for replica in replicas:
+            event.listen(replica.engine.sync_engine, 'handle_error', self._on_error(replica))
+
+    def _on_error(self, replica: Replica):
+        def handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect or context.connection is None:
+                self.mark(replica, healthy=False)
+
+        return handle_error
+
+    def mark(self, replica: Replica, healthy: bool) -> None:
+        if replica.healthy and not healthy:
+            logger.warning('Database replica %s marked unhealthy', replica.name)
+        elif healthy and not replica.healthy:
+            logger.info('Database replica %s is healthy again', replica.name)
+
+        replica.healthy = healthy
+        replica.failures = 0 if healthy else replica.failures + 1
+        replica.checked_at = time.time()
+
+    def pick(self) -> Optional[Replica]:
+        healthy: List[Replica] = [replica for replica in self.replicas if replica.healthy]
+
+        if not healthy:
+            return None
+
+        return healthy[next(self._counter) % len(healthy)]
+
+    async def check(self, timeout: float) -> None:
+        async def ping(replica: Replica) -> None:
+            try:
+                async with replica.engine.connect() as connection:
+                    await asyncio.wait_for(connection.execute(text('SELECT 1')), timeout)
+            except Exception:
+                self.mark(replica, healthy=False)
+            else:
+                self.mark(replica, healthy=True)
+
+        await asyncio.gather(*(ping(replica) for replica in self.replicas))
+
+    async def run(self, interval: float) -> None:
+        while True:
+            await self.check(timeout=interval)
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+class RoutingSession(Session):
+    def __init__(self, primary: Engine, replicas: ReplicaSet, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self.primary: Engine = primary
+        self.replicas: ReplicaSet = replicas
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Engine:
+        if (
+            self.info.get('primary')
+            or primary_pinned.get()
+            or self._flushing
+            or clause is None
+            or isinstance(clause, UpdateBase)
+        ):
+            self.info['primary'] = True
+
+            return self.primary
+
+        replica: Optional[Replica] = self.info.get('replica')
+
+        if replica is None or not replica.healthy:
+            replica = self.replicas.pick()
+            self.info['replica'] = replica
+
+        if replica is None:
+            return self.primary
+
+        return replica.engine.sync_engine
+
+
+@event.listens_for(Session, 'after_commit')
+def pin_primary(session: Session) -> None:
+    if isinstance(session, RoutingSession) and not session.info.get('primary'):
+        return
+
+    primary_pinned.set(True)
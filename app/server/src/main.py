@@ -2,4 +2,4 @@ from fastapi import FastAPI
 from .server import server
 
 
-app: FastAPI = server
\ No newline at end of file
+app: FastAPI = server()
\ No newline at end of file
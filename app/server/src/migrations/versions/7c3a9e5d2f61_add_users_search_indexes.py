@@ -0,0 +1,103 @@
+"""add users search indexes
+
+Revision ID: 7c3a9e5d2f61
+Revises: 4b7e2c91a0d3
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c3a9e5d2f61"
+down_revision: Union[str, None] = "4b7e2c91a0d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def check_case_duplicates() -> None:
+    if op.get_context().as_sql:
+        return
+
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT lower(email) AS email, count(*) AS total FROM users "
+            "GROUP BY lower(email) HAVING count(*) > 1 ORDER BY total DESC, email"
+        )
+    ).all()
+
+    if duplicates:
+        examples = ", ".join(f"{row.email} ({row.total})" for row in duplicates[:10])
+
+        raise RuntimeError(
+            f"Cannot create unique index ix_users_email_lower: {len(duplicates)} "
+            f"emails exist in several letter cases, e.g. {examples}. Merge or "
+            "rename these accounts (SELECT id, email FROM users WHERE lower(email) "
+            "IN (...)) and run the migration again."
+        )
+
+
+def create_index_concurrently(name: str, columns: Sequence[Union[str, sa.TextClause]], **kw) -> None:
+    # A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, so drop
+    # any leftover from an earlier run first and clean up after a failure.
+    op.drop_index(name, table_name="users", postgresql_concurrently=True, if_exists=True)
+
+    try:
+        op.create_index(name, "users", columns, postgresql_concurrently=True, **kw)
+    except sa.exc.DBAPIError:
+        op.drop_index(name, table_name="users", postgresql_concurrently=True, if_exists=True)
+        raise
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    check_case_duplicates()
+
+    with op.get_context().autocommit_block():
+        create_index_concurrently(
+            "ix_users_email_lower",
+            [sa.text("lower(email) text_pattern_ops")],
+            unique=True,
+        )
+        create_index_concurrently(
+            "ix_users_first_name_trgm",
+            ["first_name"],
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        )
+        create_index_concurrently(
+            "ix_users_last_name_trgm",
+            ["last_name"],
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        )
+
+    op.drop_constraint("uq_users_email", "users", type_="unique")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint("uq_users_email", "users", ["email"])
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_last_name_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_first_name_trgm",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_email_lower",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
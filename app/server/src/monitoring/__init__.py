@@ -0,0 +1,63 @@
+import os
+
+from prometheus_client import multiprocess
+
+from .metrics import (
+    db_pool_checked_out,
+    db_pool_checkout_wait_seconds,
+    db_pool_hold_seconds,
+    db_pool_overflow,
+    db_pool_size,
+    hash_duration_seconds,
+    hash_wait_seconds,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+    jwt_duration_seconds,
+)
+from .middleware import MetricsMiddleware
+from .pool import InstrumentedQueuePool
+from .profiler import ProfileEntry, ProfileStore, ProfilerMiddleware, profile_store
+from .timing import (
+    RequestTimings,
+    TimingMiddleware,
+    instrument_engine,
+    record,
+    request_timings,
+    timed,
+)
+from .views import router
+
+
+def mark_process_dead() -> None:
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+__all__ = [
+    'db_pool_checked_out',
+    'db_pool_checkout_wait_seconds',
+    'db_pool_hold_seconds',
+    'db_pool_overflow',
+    'db_pool_size',
+    'hash_duration_seconds',
+    'hash_wait_seconds',
+    'http_request_duration_seconds',
+    'http_requests_in_flight',
+    'http_requests_total',
+    'jwt_duration_seconds',
+    'MetricsMiddleware',
+    'InstrumentedQueuePool',
+    'ProfileEntry',
+    'ProfileStore',
+    'ProfilerMiddleware',
+    'profile_store',
+    'RequestTimings',
+    'TimingMiddleware',
+    'instrument_engine',
+    'record',
+    'request_timings',
+    'timed',
+    'mark_process_dead',
+    'router',
+]
@@ -0,0 +1,79 @@
+from typing import Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+WAIT_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0
+)
+
+
+http_requests_total: Counter = Counter(
+    'http_requests_total',
+    'HTTP requests by route template, method and status code',
+    ['method', 'route', 'status']
+)
+http_request_duration_seconds: Histogram = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route template and method',
+    ['method', 'route'],
+    buckets=LATENCY_BUCKETS
+)
+http_requests_in_flight: Gauge = Gauge(
+    'http_requests_in_flight',
+    'HTTP requests currently being served',
+    multiprocess_mode='livesum'
+)
+
+db_pool_checkout_wait_seconds: Histogram = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a database connection from the pool',
+    ['pool'],
+    buckets=WAIT_BUCKETS
+)
+db_pool_hold_seconds: Histogram = Histogram(
+    'db_pool_hold_seconds',
+    'Time a database connection stays checked out before it is returned to the pool',
+    ['pool'],
+    buckets=LATENCY_BUCKETS
+)
+db_pool_size: Gauge = Gauge(
+    'db_pool_size',
+    'Configured database pool size',
+    ['pool'],
+    multiprocess_mode='livesum'
+)
+db_pool_checked_out: Gauge = Gauge(
+    'db_pool_checked_out',
+    'Database connections currently checked out',
+    ['pool'],
+    multiprocess_mode='livesum'
+)
+db_pool_overflow: Gauge = Gauge(
+    'db_pool_overflow',
+    'Database connections open beyond the pool size',
+    ['pool'],
+    multiprocess_mode='livesum'
+)
+
+hash_wait_seconds: Histogram = Histogram(
+    'hash_wait_seconds',
+    'Time password hashing jobs spend queued for a hash pool worker',
+    ['operation'],
+    buckets=WAIT_BUCKETS
+)
+hash_duration_seconds: Histogram = Histogram(
+    'hash_duration_seconds',
+    'Password hashing and verification time',
+    ['operation'],
+    buckets=LATENCY_BUCKETS
+)
+jwt_duration_seconds: Histogram = Histogram(
+    'jwt_duration_seconds',
+    'JWT signing and verification time',
+    ['operation'],
+    buckets=WAIT_BUCKETS
+)
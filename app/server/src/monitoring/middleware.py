@@ -0,0 +1,62 @@
+import time
+from typing import Any, Dict, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import (
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+)
+
+
+UNMATCHED_ROUTE: str = '<unmatched>'
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app: ASGIApp = app
+        self._durations: Dict[Tuple[str, str], Any] = {}
+        self._counts: Dict[Tuple[str, str, int], Any] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status: int = 500
+        started: float = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+
+            if message['type'] == 'http.response.start':
+                status = message['status']
+
+            await send(message)
+
+        http_requests_in_flight.inc()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+
+            route: Any = scope.get('route')
+            path: str = getattr(route, 'path', UNMATCHED_ROUTE)
+            method: str = scope['method']
+
+            duration_key: Tuple[str, str] = (method, path)
+            duration: Any = self._durations.get(duration_key)
+
+            if duration is None:
+                duration = self._durations[duration_key] = http_request_duration_seconds.labels(method, path)
+
+            count_key: Tuple[str, str, int] = (method, path, status)
+            count: Any = self._counts.get(count_key)
+
+            if count is None:
+                count = self._counts[count_key] = http_requests_total.labels(method, path, str(status))
+
+            duration.observe(time.perf_counter() - started)
+            count.inc()
@@ -0,0 +1,56 @@
+import time
+from typing import Any, Optional
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .metrics import (
+    db_pool_checked_out,
+    db_pool_checkout_wait_seconds,
+    db_pool_hold_seconds,
+    db_pool_overflow,
+    db_pool_size,
+)
+from .timing import record as record_timing
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.label: str = self.logging_name or 'primary'
+
+        db_pool_size.labels(self.label).set(self.size())
+
+    def _update_gauges(self) -> None:
+        db_pool_checked_out.labels(self.label).set(self.checkedout())
+        db_pool_overflow.labels(self.label).set(max(self.overflow(), 0))
+
+    def _do_get(self) -> Any:
+        started: float = time.perf_counter()
+
+        try:
+            entry: Any = super()._do_get()
+            entry.info['checked_out_at'] = time.perf_counter()
+
+            return entry
+        finally:
+            db_pool_checkout_wait_seconds.labels(self.label).observe(time.perf_counter() - started)
+            self._update_gauges()
+
+    def _do_return_conn(self, record: Any) -> None:
+        checked_out_at: Optional[float] = record.info.pop('checked_out_at', None)
+
+        super()._do_return_conn(record)
+
+        if checked_out_at is not None:
+            held: float = time.perf_counter() - checked_out_at
+
+            db_pool_hold_seconds.labels(self.label).observe(held)
+            record_timing('db_hold', held)
+
+        self._update_gauges()
+
+    def dispose(self) -> None:
+        super().dispose()
+
+        self._update_gauges()
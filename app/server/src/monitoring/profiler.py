@@ -0,0 +1,151 @@
+import cProfile
+import hmac
+import logging
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import anyio
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config import app
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+PROFILE_ID_PATTERN: re.Pattern = re.compile(r'^\d+-[A-Z]+-[\w.-]+$')
+
+
+@dataclass
+class ProfileEntry:
+    id: str
+    size: int
+    created_at: datetime
+
+
+class ProfileStore:
+    def __init__(self, directory: Path, max_profiles: int) -> None:
+        self.directory: Path = directory
+        self.max_profiles: int = max_profiles
+
+    def path(self, profile_id: str) -> Optional[Path]:
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+
+        path: Path = self.directory / f'{profile_id}.pstats'
+
+        return path if path.is_file() else None
+
+    @staticmethod
+    def new_id(method: str, route: str) -> str:
+        name: str = re.sub(r'[^\w.-]+', '_', route).strip('_') or 'root'
+
+        return f'{time.time_ns() // 1000}-{method}-{name}'
+
+    def save(self, profile_id: str, profile: cProfile.Profile) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        profile.dump_stats(self.directory / f'{profile_id}.pstats')
+
+        for stale in self._files()[:-self.max_profiles]:
+            stale.unlink(missing_ok=True)
+
+    def list(self) -> List[ProfileEntry]:
+        entries: List[ProfileEntry] = []
+
+        for path in reversed(self._files()):
+            stat = path.stat()
+            entries.append(ProfileEntry(
+                id=path.stem,
+                size=stat.st_size,
+                created_at=datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+            ))
+
+        return entries
+
+    def _files(self) -> List[Path]:
+        if not self.directory.is_dir():
+            return []
+
+        return sorted(
+            self.directory.glob('*.pstats'),
+            key=lambda path: int(path.stem.split('-', 1)[0])
+        )
+
+
+profile_store: ProfileStore = ProfileStore(
+    directory=app.profiler.directory,
+    max_profiles=app.profiler.max_profiles,
+)
+
+
+class ProfilerMiddleware:
+    """Profile authorized requests with cProfile, one at a time.
+
+    cProfile hooks the event-loop thread, not a task, so a profile also
+    records every other coroutine that ran while the request was in flight.
+    Profiled requests are serialized behind a lock so that two profiles never
+    overlap; read them with the rest of the traffic in mind.
+    """
+
+    def __init__(self, app: ASGIApp, header: str, token: Optional[str], debug: bool) -> None:
+        self.app: ASGIApp = app
+        self.header: bytes = header.lower().encode('latin-1')
+        self.response_header: str = f'{header}-Id'
+        self.token: Optional[bytes] = token.encode() if token else None
+        self.debug: bool = debug
+
+        self._lock: anyio.Lock = anyio.Lock()
+
+    def authorized(self, scope: Scope) -> bool:
+        for key, value in scope['headers']:
+            if key == self.header:
+                if self.debug:
+                    return True
+
+                return self.token is not None and hmac.compare_digest(value, self.token)
+
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or not self.authorized(scope):
+            await self.app(scope, receive, send)
+            return
+
+        async with self._lock:
+            await self.profile(scope, receive, send)
+
+    async def profile(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profile: cProfile.Profile = cProfile.Profile()
+        profile_id: Optional[str] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal profile_id
+
+            if message['type'] == 'http.response.start':
+                profile_id = profile_store.new_id(
+                    scope['method'],
+                    getattr(scope.get('route'), 'path', scope['path'])
+                )
+                MutableHeaders(scope=message).append(self.response_header, profile_id)
+
+            await send(message)
+
+        profile.enable()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.disable()
+
+        if profile_id is None:
+            return
+
+        try:
+            await anyio.to_thread.run_sync(profile_store.save, profile_id, profile)
+        except OSError:
+            logger.warning('Could not store request profile %s', profile_id, exc_info=True)
@@ -0,0 +1,134 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RequestTimings:
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    db_hold_seconds: float = 0.0
+    hash_seconds: float = 0.0
+    jwt_seconds: float = 0.0
+    serialize_seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def server_timing(self, total: float) -> str:
+        return ', '.join([
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.db_queries} queries"',
+            f'db-hold;dur={self.db_hold_seconds * 1000:.2f}',
+            f'hash;dur={self.hash_seconds * 1000:.2f}',
+            f'jwt;dur={self.jwt_seconds * 1000:.2f}',
+            f'serialize;dur={self.serialize_seconds * 1000:.2f}',
+            f'total;dur={total * 1000:.2f}',
+        ])
+
+
+request_timings: ContextVar[Optional[RequestTimings]] = ContextVar('request_timings', default=None)
+
+
+def record(kind: str, seconds: float) -> None:
+    timings: Optional[RequestTimings] = request_timings.get()
+
+    if timings is not None:
+        setattr(timings, f'{kind}_seconds', getattr(timings, f'{kind}_seconds') + seconds)
+
+
+@contextmanager
+def timed(kind: str, histogram: Any) -> Iterator[None]:
+    started: float = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        elapsed: float = time.perf_counter() - started
+
+        histogram.observe(elapsed)
+        record(kind, elapsed)
+
+
+def instrument_engine(engine: Engine) -> None:
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        started: float = conn.info['query_started'].pop()
+        timings: Optional[RequestTimings] = request_timings.get()
+
+        if timings is not None:
+            timings.db_queries += 1
+            timings.db_seconds += time.perf_counter() - started
+            timings.statements[statement] += 1
+
+
+class TimingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        header: bool = False,
+        warn: bool = False,
+        max_queries: int = 10
+    ) -> None:
+        self.app: ASGIApp = app
+        self.header: bool = header
+        self.warn: bool = warn
+        self.max_queries: int = max_queries
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        timings: RequestTimings = RequestTimings()
+        token = request_timings.set(timings)
+        started: float = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if self.header and message['type'] == 'http.response.start':
+                headers: MutableHeaders = MutableHeaders(scope=message)
+                headers.append('Server-Timing', timings.server_timing(time.perf_counter() - started))
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_timings.reset(token)
+
+            if self.warn:
+                self.check(scope, timings)
+
+    def check(self, scope: Scope, timings: RequestTimings) -> None:
+        route: str = getattr(scope.get('route'), 'path', scope['path'])
+
+        if timings.db_queries > self.max_queries:
+            logger.warning(
+                '%s %s ran %d queries (limit %d)',
+                scope['method'], route, timings.db_queries, self.max_queries
+            )
+
+        repeated: List[Tuple[str, int]] = [
+            (statement, count)
+            for statement, count in timings.statements.items()
+            if count > 1
+        ]
+
+        for statement, count in repeated:
+            logger.warning(
+                '%s %s repeated a statement %d times: %s',
+                scope['method'], route, count, ' '.join(statement.split())
+            )
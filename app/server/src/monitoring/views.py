@@ -0,0 +1,31 @@
+import os
+
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+from src.config import app
+
+
+router: APIRouter = APIRouter()
+
+@router.get(
+    path=app.metrics.endpoint,
+    include_in_schema=False
+)
+def metrics_handler() -> Response:
+    registry: CollectorRegistry = REGISTRY
+
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    return Response(
+        content=generate_latest(registry),
+        media_type=CONTENT_TYPE_LATEST
+    )
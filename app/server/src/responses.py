@@ -0,0 +1,40 @@
+import time
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.background import BackgroundTask
+
+from src.monitoring import record
+
+
+class APIResponse(ORJSONResponse):
+    adapter: Optional[TypeAdapter] = None
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        adapter: Optional[TypeAdapter] = None
+    ) -> None:
+        if adapter is not None:
+            self.adapter = adapter
+
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:
+        started: float = time.perf_counter()
+
+        if self.adapter is not None:
+            rendered: bytes = self.adapter.dump_json(content)
+        elif isinstance(content, BaseModel):
+            rendered = content.__pydantic_serializer__.to_json(content)
+        else:
+            rendered = super().render(content)
+
+        record('serialize', time.perf_counter() - started)
+
+        return rendered
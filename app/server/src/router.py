@@ -0,0 +1,23 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter
+
+from .api.v1.router import router as v1
+from .schemas import ErrorResponse
+
+
+router: APIRouter = APIRouter(
+    responses={
+        HTTPStatus.BAD_REQUEST.value: {"model": ErrorResponse},
+        HTTPStatus.UNAUTHORIZED.value: {"model": ErrorResponse},
+        HTTPStatus.FORBIDDEN.value: {"model": ErrorResponse},
+        HTTPStatus.NOT_FOUND.value: {"model": ErrorResponse},
+        HTTPStatus.CONFLICT.value: {"model": ErrorResponse},
+        HTTPStatus.TOO_MANY_REQUESTS.value: {"model": ErrorResponse},
+        HTTPStatus.INTERNAL_SERVER_ERROR.value: {"model": ErrorResponse},
+        HTTPStatus.SERVICE_UNAVAILABLE.value: {"model": ErrorResponse},
+    },
+)
+router.include_router(v1)
+
+__all__ = ['router']
\ No newline at end of file
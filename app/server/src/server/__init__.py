@@ -1,17 +1,32 @@
+import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from starlette.staticfiles import StaticFiles
 
 from src.config import app
-from fastapi import FastAPI
-from starlette.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request, Response
+from starlette.responses import HTMLResponse
 from starlette.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import (get_swagger_ui_html,
                                   get_swagger_ui_oauth2_redirect_html,
                                   get_redoc_html)
 
 from src.database import db_helper
+from src.responses import APIResponse
+from src.storage import redis_helper
+from src.api.v1.services.crud import CRUDService
+from src.api.v1.services.hash import HashService
+from src.api.v1.services.jwt import jwt_keys
+from src.api.v1.services.revocation import RevocationService
+from src.monitoring import (
+    MetricsMiddleware,
+    ProfilerMiddleware,
+    TimingMiddleware,
+    mark_process_dead,
+)
+
+from .openapi import OpenAPIDocument
 
 
 class Server:
@@ -20,16 +35,24 @@ class Server:
             debug=app.debug,
             title=app.title,
             description=app.description,
-            default_response_class=JSONResponse,
+            default_response_class=APIResponse,
             version=app.version,
+            openapi_url=None,
             docs_url=None,
             redoc_url=None
         )
+        self.openapi: OpenAPIDocument = OpenAPIDocument(
+            application=self.application,
+            path=app.swagger.openapi_file
+        )
 
         self._init_router()
         self._init_middleware()
         self._init_lifespan()
 
+        if app.swagger.openapi_enabled:
+            self._init_openapi()
+
         if app.debug:
             self._init_swagger()
 
@@ -37,10 +60,15 @@ class Server:
         return self.application
 
     def _init_router(self) -> None:
-        from src import router
+        from src.router import router
 
         self.application.include_router(router)
 
+        if app.metrics.enabled:
+            from src.monitoring import router as metrics_router
+
+            self.application.include_router(metrics_router)
+
     def _init_middleware(self) -> None:
         self.application.add_middleware(
             CORSMiddleware,
@@ -50,13 +78,71 @@ class Server:
             allow_headers=app.cors.headers
         )
 
+        if app.profiler.enabled:
+            self.application.add_middleware(
+                ProfilerMiddleware,
+                header=app.profiler.header,
+                token=app.profiler.token.get_secret_value() if app.profiler.token else None,
+                debug=app.debug
+            )
+
+        if app.metrics.server_timing or app.debug:
+            self.application.add_middleware(
+                TimingMiddleware,
+                header=app.metrics.server_timing,
+                warn=app.debug,
+                max_queries=app.metrics.max_queries
+            )
+
+        if app.metrics.enabled:
+            self.application.add_middleware(MetricsMiddleware)
+
     def _init_lifespan(self) -> None:
         @asynccontextmanager
-        async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+        async def lifespan(application: FastAPI) -> AsyncGenerator[None, None]:
+            if not app.lazy_startup:
+                jwt_keys.load()
+
+                if app.database.warm_up:
+                    await db_helper.warm_up([
+                        CRUDService().select_user_by_email(''),
+                        CRUDService().select_user_by_id(0),
+                    ])
+                else:
+                    # Create the engine and its pool now rather than on the first request
+                    db_helper.engine
+
+                if app.swagger.openapi_enabled:
+                    self.openapi.build()
+
+            revocation_sync: asyncio.Task = asyncio.create_task(RevocationService().run_sync())
+            replica_checks: Optional[asyncio.Task] = None
+
+            if db_helper.replica_urls:
+                replica_checks = asyncio.create_task(db_helper.replicas.run(
+                    app.database.replica_check_interval.total_seconds()
+                ))
+
             yield
+            revocation_sync.cancel()
+
+            if replica_checks is not None:
+                replica_checks.cancel()
+
             await db_helper.dispose()
+            await redis_helper.dispose()
+            HashService().shutdown()
+            mark_process_dead()
 
-        self.application.lifespan = lifespan
+        self.application.router.lifespan_context = lifespan
+
+    def _init_openapi(self) -> None:
+        @self.application.get(
+            path=app.swagger.openapi_url,
+            include_in_schema=False
+        )
+        def openapi_handler(request: Request) -> Response:
+            return self.openapi.response(request)
 
     def _init_swagger(self) -> None:
         self.application.mount(
@@ -73,7 +159,7 @@ class Server:
         )
         async def custom_swagger_ui_html_handler() -> HTMLResponse:
             return get_swagger_ui_html(
-                openapi_url=self.application.openapi_url,
+                openapi_url=app.swagger.openapi_url,
                 title=f'{app.title} - {app.swagger.docs.title}',
                 oauth2_redirect_url=self.application.swagger_ui_oauth2_redirect_url,
                 swagger_js_url=f'{app.swagger.static_path}/swagger-ui-bundle.js',
@@ -91,7 +177,7 @@ class Server:
         )
         async def redoc_html() -> HTMLResponse:
             return get_redoc_html(
-                openapi_url=self.application.openapi_url,
+                openapi_url=app.swagger.openapi_url,
                 title=f'{app.title} - {app.swagger.redoc.title}',
                 redoc_js_url=f'{app.swagger.static_path}/redoc.standalone.js',
             )
@@ -0,0 +1,51 @@
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+import orjson
+from fastapi import FastAPI, Request, Response
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+
+class OpenAPIDocument:
+    def __init__(self, application: FastAPI, path: Optional[Path] = None) -> None:
+        self.application: FastAPI = application
+        self.path: Optional[Path] = path
+
+        self.content: Optional[bytes] = None
+        self.etag: Optional[str] = None
+
+    def build(self) -> bytes:
+        if self.path is not None and self.path.is_file():
+            content: bytes = self.path.read_bytes()
+        else:
+            content = orjson.dumps(self.application.openapi())
+
+        self.content = content
+        self.etag = f'"{hashlib.sha256(content).hexdigest()}"'
+
+        return content
+
+    def dump(self, path: Path) -> None:
+        path.write_bytes(self.content if self.content is not None else self.build())
+
+    def matches(self, if_none_match: str) -> bool:
+        tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+
+        return '*' in tags or self.etag in tags
+
+    def response(self, request: Request) -> Response:
+        if self.content is None:
+            self.build()
+
+        headers = {'ETag': self.etag, 'Cache-Control': 'no-cache'}
+        if_none_match: Optional[str] = request.headers.get('if-none-match')
+
+        if if_none_match is not None and self.matches(if_none_match):
+            return Response(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(
+            content=self.content,
+            media_type='application/json',
+            headers=headers
+        )
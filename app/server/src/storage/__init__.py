@@ -0,0 +1,7 @@
+from .helper import redis_helper, RedisHelper
+
+
+__all__ = [
+    'redis_helper',
+    'RedisHelper'
+]
@@ -0,0 +1,48 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.config import app
+
+
+class RedisHelper:
+    def __init__(
+        self,
+        enabled: bool = False,
+        host: str = 'localhost',
+        port: int = 6379,
+        db: int = 0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        decode_responses: bool = True,
+        socket_timeout: Optional[float] = None,
+    ) -> None:
+        self.client: Optional[Redis] = None
+
+        if enabled:
+            self.client = Redis(
+                host=host,
+                port=port,
+                db=db,
+                username=username,
+                password=password,
+                decode_responses=decode_responses,
+                socket_timeout=socket_timeout,
+                socket_connect_timeout=socket_timeout,
+            )
+
+    async def dispose(self) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+
+
+redis_helper = RedisHelper(
+    enabled=app.redis.enabled,
+    host=app.redis.host,
+    port=int(app.redis.port),
+    db=app.redis.db,
+    username=app.redis.username,
+    password=app.redis.password,
+    decode_responses=app.redis.decode_responses,
+    socket_timeout=app.redis.socket_timeout,
+)
@@ -0,0 +1,40 @@
+from typing import AsyncGenerator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.api.v1.services.cache import principal_cache, token_cache
+from src.api.v1.services.revocation import service as revocation
+from src.api.v1.services.revocation.service import RevocationList
+from src.database import Base
+from src.storage import redis_helper
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return 'asyncio'
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(redis_helper, 'client', None)
+    monkeypatch.setattr(revocation, 'revocation_list', RevocationList(
+        capacity=1000,
+        error_rate=0.001,
+        horizon=86400,
+    ))
+
+    principal_cache.clear()
+    token_cache.clear()
+
+
+@pytest.fixture
+async def session_factory() -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    engine: AsyncEngine = create_async_engine('sqlite+aiosqlite://')
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, expire_on_commit=False)
+
+    await engine.dispose()
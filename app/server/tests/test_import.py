@@ -0,0 +1,62 @@
+import pytest
+
+from src.api.v1.services.hash import hashers
+from src.api.v1.users.service import UserImportService
+
+
+ROW = {'first_name': 'Ada', 'last_name': 'Lovelace', 'email': 'ada@example.com'}
+
+
+@pytest.mark.parametrize('encoded', [
+    '$2b$12$abc',
+    '$2b$99$' + 'a' * 53,
+    '$2b$12$' + 'a' * 52 + '!',
+])
+def test_bcrypt_rejects_malformed_hashes(encoded: str) -> None:
+    bcrypt = hashers.get('bcrypt')
+
+    assert bcrypt.identify(encoded)
+    assert not bcrypt.is_valid(encoded)
+    assert not bcrypt.verify('Secret123!', encoded)
+
+
+@pytest.mark.parametrize('encoded', [
+    '$scrypt$ln=14,r=8$c2FsdA==$ZGVyaXZlZA==',
+    '$scrypt$ln=14,r=8,p=1$!!$ZGVyaXZlZA==',
+    '$scrypt$ln=14,r=8,p=1$c2FsdA==',
+])
+def test_scrypt_rejects_malformed_hashes(encoded: str) -> None:
+    scrypt = hashers.get('scrypt')
+
+    assert scrypt.identify(encoded)
+    assert not scrypt.is_valid(encoded)
+    assert not scrypt.verify('Secret123!', encoded)
+
+
+@pytest.mark.parametrize('name', ['bcrypt', 'scrypt'])
+def test_generated_hashes_are_valid(name: str) -> None:
+    assert hashers.get(name).is_valid(hashers.get(name).hash('Secret123!'))
+
+
+def test_import_rejects_malformed_hash() -> None:
+    values, error = UserImportService().validate(3, {**ROW, 'hashed_password': '$2b$12$abc'})
+
+    assert values is None
+    assert error.line == 3
+    assert error.msg == 'Malformed bcrypt password hash'
+
+
+def test_import_rejects_unknown_hash() -> None:
+    values, error = UserImportService().validate(3, {**ROW, 'hashed_password': '$md5$abc'})
+
+    assert values is None
+    assert error.msg == 'Unsupported password hash format'
+
+
+def test_import_accepts_valid_hash() -> None:
+    encoded: str = hashers.get('bcrypt').hash('Secret123!')
+    values, error = UserImportService().validate(3, {**ROW, 'hashed_password': encoded})
+
+    assert error is None
+    assert values['hashed_password'] == encoded
+    assert values['hashed']
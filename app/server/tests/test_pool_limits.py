@@ -0,0 +1,32 @@
+import pytest
+
+from src.config.components.database import DatabaseConfig
+from src.database.helper import worker_pool_limits
+
+
+def test_default_cap_matches_postgres_default() -> None:
+    assert DatabaseConfig.model_fields['max_connections'].default == 100
+
+
+@pytest.mark.parametrize(('workers', 'expected'), [
+    (1, (5, 10)),
+    (4, (5, 10)),
+    (8, (5, 7)),
+    (16, (5, 1)),
+    (32, (3, 0)),
+    (200, (1, 0)),
+])
+def test_worker_pool_limits_stay_within_max_connections(workers: int, expected: tuple) -> None:
+    pool_size, max_overflow = worker_pool_limits(
+        pool_size=5,
+        max_overflow=10,
+        max_connections=100,
+        workers=workers
+    )
+
+    assert (pool_size, max_overflow) == expected
+    assert workers * (pool_size + max_overflow) <= max(100, workers)
+
+
+def test_worker_pool_limits_without_cap() -> None:
+    assert worker_pool_limits(pool_size=5, max_overflow=10, max_connections=None, workers=64) == (5, 10)
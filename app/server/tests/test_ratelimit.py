@@ -0,0 +1,160 @@
+import asyncio
+from typing import AsyncGenerator, List
+
+import httpx
+import pytest
+from fakeredis import FakeAsyncRedis
+from starlette.requests import Request
+
+from src.api.v1.services.hash import HashService
+from src.api.v1.services.ratelimit import RateLimitService
+from src.api.v1.services.ratelimit import service as ratelimit
+from src.api.v1.services.ratelimit.service import (
+    MemoryRateLimitBackend,
+    RateLimitResult,
+    RedisRateLimitBackend,
+    parse_trusted_proxies,
+)
+from src.config import app
+from src.database import db_helper
+from src.main import app as application
+from src.storage import redis_helper
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(params=['memory', 'redis'])
+def backend(request: pytest.FixtureRequest) -> MemoryRateLimitBackend | RedisRateLimitBackend:
+    if request.param == 'redis':
+        return RedisRateLimitBackend(FakeAsyncRedis())
+
+    return MemoryRateLimitBackend()
+
+
+def make_request(client: str, forwarded_for: str | None = None) -> Request:
+    headers: List[tuple] = []
+
+    if forwarded_for is not None:
+        headers.append((b'x-forwarded-for', forwarded_for.encode()))
+
+    return Request({
+        'type': 'http',
+        'method': 'POST',
+        'path': '/',
+        'headers': headers,
+        'client': (client, 50000),
+    })
+
+
+async def test_sliding_window_allows_up_to_limit(backend) -> None:
+    results: List[RateLimitResult] = [await backend.hit('login:ip:1', limit=3, window=60) for _ in range(4)]
+
+    assert [result.allowed for result in results] == [True, True, True, False]
+    assert 0 < results[-1].retry_after <= 60
+
+
+async def test_sliding_window_keys_are_independent(backend) -> None:
+    assert (await backend.hit('login:ip:1', limit=1, window=60)).allowed
+    assert not (await backend.hit('login:ip:1', limit=1, window=60)).allowed
+    assert (await backend.hit('login:ip:2', limit=1, window=60)).allowed
+
+
+async def test_sliding_window_frees_slots_as_hits_expire(backend) -> None:
+    assert (await backend.hit('login:ip:1', limit=2, window=0.5)).allowed
+    await asyncio.sleep(0.3)
+    assert (await backend.hit('login:ip:1', limit=2, window=0.5)).allowed
+    assert not (await backend.hit('login:ip:1', limit=2, window=0.5)).allowed
+
+    await asyncio.sleep(0.3)
+
+    assert (await backend.hit('login:ip:1', limit=2, window=0.5)).allowed
+    assert not (await backend.hit('login:ip:1', limit=2, window=0.5)).allowed
+
+
+async def test_denied_redis_hits_do_not_extend_the_window() -> None:
+    client: FakeAsyncRedis = FakeAsyncRedis()
+    backend: RedisRateLimitBackend = RedisRateLimitBackend(client)
+
+    for _ in range(5):
+        await backend.hit('login:ip:1', limit=2, window=60)
+
+    assert await client.zcard('ratelimit:login:ip:1') == 2
+
+
+async def test_memory_backend_evicts_oldest_keys() -> None:
+    backend: MemoryRateLimitBackend = MemoryRateLimitBackend(max_keys=2)
+
+    for key in ('a', 'b', 'c'):
+        await backend.hit(key, limit=1, window=60)
+
+    assert (await backend.hit('a', limit=1, window=60)).allowed
+    assert not (await backend.hit('c', limit=1, window=60)).allowed
+
+
+async def test_hit_uses_redis_when_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    client: FakeAsyncRedis = FakeAsyncRedis()
+    monkeypatch.setattr(redis_helper, 'client', client)
+
+    await RateLimitService().hit('login:ip:1', limit=5, window=60)
+
+    assert await client.zcard('ratelimit:login:ip:1') == 1
+
+
+def test_parse_trusted_proxies() -> None:
+    assert [str(network) for network in parse_trusted_proxies('127.0.0.1, 10.0.0.0/8,')] == [
+        '127.0.0.1/32',
+        '10.0.0.0/8',
+    ]
+    assert [str(network) for network in parse_trusted_proxies('*')] == ['0.0.0.0/0', '::/0']
+
+
+@pytest.mark.parametrize(
+    ('client', 'forwarded_for', 'expected'),
+    [
+        ('203.0.113.7', None, '203.0.113.7'),
+        ('203.0.113.7', '198.51.100.1', '203.0.113.7'),
+        ('10.0.0.2', None, '10.0.0.2'),
+        ('10.0.0.2', '198.51.100.1', '198.51.100.1'),
+        ('10.0.0.2', '1.2.3.4, 198.51.100.1', '198.51.100.1'),
+        ('10.0.0.2', '198.51.100.1, 10.0.0.3', '198.51.100.1'),
+        ('10.0.0.2', '10.0.0.4, 10.0.0.3', '10.0.0.4'),
+    ]
+)
+def test_client_ip(monkeypatch: pytest.MonkeyPatch, client: str, forwarded_for: str | None, expected: str) -> None:
+    monkeypatch.setattr(ratelimit, 'trusted_proxies', parse_trusted_proxies('10.0.0.0/8'))
+
+    assert RateLimitService().client_ip(make_request(client, forwarded_for)) == expected
+
+
+async def test_login_is_throttled_before_database_and_hash_work(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(app.rate_limit, 'enabled', True)
+    monkeypatch.setattr(app.rate_limit, 'ip_limit', 100)
+    monkeypatch.setattr(app.rate_limit, 'email_limit', 1)
+    monkeypatch.setattr(ratelimit, 'memory_backend', MemoryRateLimitBackend())
+    monkeypatch.setattr(redis_helper, 'client', None)
+
+    calls: List[str] = []
+
+    async def session_getter() -> AsyncGenerator[None, None]:
+        calls.append('session')
+        yield None
+
+    async def avalidate(*args, **kwargs) -> bool:
+        calls.append('hash')
+        return False
+
+    monkeypatch.setattr(HashService, 'avalidate', staticmethod(avalidate))
+    monkeypatch.setitem(application.dependency_overrides, db_helper.session_getter, session_getter)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=application), base_url='http://test') as client:
+        await RateLimitService().hit('login:email:user@example.com', limit=1, window=60)
+
+        response: httpx.Response = await client.post(
+            '/v1/auth/token',
+            data={'username': 'user@example.com', 'password': 'Secret123!'}
+        )
+
+    assert response.status_code == 429
+    assert 0 < int(response.headers['retry-after']) <= 60
+    assert calls == []
@@ -0,0 +1,170 @@
+import asyncio
+from datetime import timedelta
+from typing import Any, AsyncGenerator, Dict
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.api.v1.auth.schemas import Token
+from src.api.v1.auth.service import AuthService
+from src.api.v1.services.jwt import JWTService
+from src.api.v1.services.refresh import RefreshTokenStore, RotateResult
+from src.api.v1.services.refresh.service import DatabaseRefreshTokenStore, RedisRefreshTokenStore
+from src.api.v1.services.revocation import RevocationService
+from src.database import User
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def session(session_factory: async_sessionmaker[AsyncSession]) -> AsyncGenerator[AsyncSession, None]:
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+async def user(session: AsyncSession) -> User:
+    user: User = User(first_name='Ada', last_name='Lovelace', email='ada@example.com', hashed_password='x')
+    session.add(user)
+    await session.commit()
+
+    return user
+
+
+@pytest.fixture(params=['database', 'redis'])
+def store(request: pytest.FixtureRequest, session: AsyncSession) -> RefreshTokenStore:
+    if request.param == 'redis':
+        return RedisRefreshTokenStore(FakeAsyncRedis())
+
+    return DatabaseRefreshTokenStore(session)
+
+
+def test_store_interface_is_abstract() -> None:
+    class IncompleteStore(RefreshTokenStore):
+        async def create(self, family: str, jti: str, user_id: int, ttl: timedelta) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        IncompleteStore()
+
+
+async def test_store_rotates_current_jti(store: RefreshTokenStore, user: User) -> None:
+    await store.create('family', 'jti-1', user.id, timedelta(days=1))
+
+    assert await store.rotate('family', 'jti-1', 'jti-2', timedelta(days=1)) is RotateResult.ROTATED
+    assert await store.rotate('family', 'jti-2', 'jti-3', timedelta(days=1)) is RotateResult.ROTATED
+
+
+async def test_store_reuse_revokes_family(store: RefreshTokenStore, user: User) -> None:
+    await store.create('family', 'jti-1', user.id, timedelta(days=1))
+    await store.rotate('family', 'jti-1', 'jti-2', timedelta(days=1))
+
+    assert await store.rotate('family', 'jti-1', 'jti-3', timedelta(days=1)) is RotateResult.REUSED
+    assert await store.rotate('family', 'jti-2', 'jti-4', timedelta(days=1)) is not RotateResult.ROTATED
+
+
+async def test_store_revoke(store: RefreshTokenStore, user: User) -> None:
+    await store.create('family', 'jti-1', user.id, timedelta(days=1))
+    await store.revoke('family')
+
+    assert await store.rotate('family', 'jti-1', 'jti-2', timedelta(days=1)) is not RotateResult.ROTATED
+
+
+async def test_store_unknown_family(store: RefreshTokenStore) -> None:
+    assert await store.rotate('missing', 'jti-1', 'jti-2', timedelta(days=1)) is RotateResult.UNKNOWN
+
+
+async def test_database_store_rejects_expired_family(session: AsyncSession, user: User) -> None:
+    store: DatabaseRefreshTokenStore = DatabaseRefreshTokenStore(session)
+    await store.create('family', 'jti-1', user.id, timedelta(seconds=-1))
+
+    assert await store.rotate('family', 'jti-1', 'jti-2', timedelta(days=1)) is not RotateResult.ROTATED
+
+
+async def test_redis_store_rejects_expired_family() -> None:
+    store: RedisRefreshTokenStore = RedisRefreshTokenStore(FakeAsyncRedis())
+    await store.create('family', 'jti-1', 1, timedelta(seconds=1))
+    await asyncio.sleep(1.1)
+
+    assert await store.rotate('family', 'jti-1', 'jti-2', timedelta(days=1)) is RotateResult.UNKNOWN
+
+
+async def refresh(session: AsyncSession, refresh_token: str) -> Token:
+    return await AuthService().refresh_tokens(session=session, refresh_token=refresh_token)
+
+
+async def test_refresh_rotates_tokens(session: AsyncSession, user: User) -> None:
+    issued: Token = await AuthService().issue_tokens(session=session, user=user)
+    rotated: Token = await refresh(session, issued.refresh_token)
+
+    old: Dict[str, Any] = JWTService().decode(token=issued.refresh_token)
+    new: Dict[str, Any] = JWTService().decode(token=rotated.refresh_token)
+
+    assert new['fam'] == old['fam']
+    assert new['jti'] != old['jti']
+    assert JWTService().decode(token=rotated.access_token)['sub'] == user.email
+
+
+async def test_refresh_reuse_revokes_family(session: AsyncSession, user: User) -> None:
+    issued: Token = await AuthService().issue_tokens(session=session, user=user)
+    rotated: Token = await refresh(session, issued.refresh_token)
+
+    with pytest.raises(HTTPException) as reused:
+        await refresh(session, issued.refresh_token)
+
+    with pytest.raises(HTTPException) as revoked:
+        await refresh(session, rotated.refresh_token)
+
+    assert reused.value.status_code == revoked.value.status_code == 401
+
+
+async def test_refresh_rejects_expired_token(session: AsyncSession, user: User) -> None:
+    issued: Token = await AuthService().issue_tokens(session=session, user=user)
+    claims: Dict[str, Any] = JWTService().decode(token=issued.refresh_token)
+    expired: str = AuthService.encode_refresh_token(
+        subject=user.email,
+        family=claims['fam'],
+        jti=claims['jti'],
+        expires_delta=timedelta(seconds=-1)
+    )
+
+    with pytest.raises(HTTPException) as error:
+        await refresh(session, expired)
+
+    assert error.value.status_code == 401
+
+
+async def test_refresh_rejects_access_token(session: AsyncSession, user: User) -> None:
+    issued: Token = await AuthService().issue_tokens(session=session, user=user)
+
+    with pytest.raises(HTTPException):
+        await refresh(session, issued.access_token)
+
+
+async def test_logout_revokes_access_token_and_refresh_family(session: AsyncSession, user: User) -> None:
+    issued: Token = await AuthService().issue_tokens(session=session, user=user)
+    payload: Dict[str, Any] = JWTService().decode(token=issued.access_token)
+
+    await AuthService().logout(session=session, payload=payload, refresh_token=issued.refresh_token)
+
+    assert await RevocationService().is_revoked(payload)
+
+    with pytest.raises(HTTPException):
+        await refresh(session, issued.refresh_token)
+
+
+async def test_logout_ignores_refresh_token_of_another_user(session: AsyncSession, user: User) -> None:
+    other: User = User(first_name='Alan', last_name='Turing', email='alan@example.com', hashed_password='x')
+    session.add(other)
+    await session.commit()
+
+    issued: Token = await AuthService().issue_tokens(session=session, user=user)
+    foreign: Token = await AuthService().issue_tokens(session=session, user=other)
+    payload: Dict[str, Any] = JWTService().decode(token=issued.access_token)
+
+    await AuthService().logout(session=session, payload=payload, refresh_token=foreign.refresh_token)
+
+    assert (await refresh(session, foreign.refresh_token)).refresh_token
@@ -0,0 +1,145 @@
+import time
+import uuid
+from typing import Any, Dict
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from src.api.v1.services.revocation import RevocationService
+from src.api.v1.services.revocation import service as revocation
+from src.api.v1.services.revocation.bloom import BloomFilter
+from src.api.v1.services.revocation.service import RevocationList
+from src.storage import redis_helper
+
+
+pytestmark = pytest.mark.anyio
+
+
+def token(subject: str = 'ada@example.com', issued_at_ms: int | None = None, **claims: Any) -> Dict[str, Any]:
+    issued_at_ms = int(time.time() * 1000) if issued_at_ms is None else issued_at_ms
+
+    return {
+        'sub': subject,
+        'jti': uuid.uuid4().hex,
+        'iat': issued_at_ms // 1000,
+        'iat_ms': issued_at_ms,
+        'exp': issued_at_ms // 1000 + 3600,
+        **claims,
+    }
+
+
+def worker() -> RevocationList:
+    return RevocationList(capacity=1000, error_rate=0.001, horizon=86400)
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom: BloomFilter = BloomFilter(1000, 0.001)
+    items = [uuid.uuid4().hex for _ in range(1000)]
+
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+
+
+def test_bloom_filter_false_positive_rate() -> None:
+    bloom: BloomFilter = BloomFilter(1000, 0.01)
+
+    for _ in range(1000):
+        bloom.add(uuid.uuid4().hex)
+
+    false_positives: int = sum(uuid.uuid4().hex in bloom for _ in range(10000))
+
+    assert false_positives < 300
+
+
+async def test_revoke_token_by_jti() -> None:
+    revoked: Dict[str, Any] = token()
+    other: Dict[str, Any] = token()
+
+    await RevocationService().revoke_token(jti=revoked['jti'], expires_at=revoked['exp'])
+
+    assert await RevocationService().is_revoked(revoked)
+    assert not await RevocationService().is_revoked(other)
+
+
+async def test_revoked_jti_expires_with_the_token() -> None:
+    expired: Dict[str, Any] = token()
+
+    await RevocationService().revoke_token(jti=expired['jti'], expires_at=time.time() - 1)
+
+    assert not await RevocationService().is_revoked(expired)
+
+
+async def test_revoke_user_cuts_off_earlier_tokens() -> None:
+    before: Dict[str, Any] = token(issued_at_ms=int(time.time() * 1000) - 1)
+
+    await RevocationService().revoke_user(subject='ada@example.com')
+
+    not_before: float = revocation.revocation_list.users['ada@example.com']
+
+    assert await RevocationService().is_revoked(before)
+    assert not await RevocationService().is_revoked(token(issued_at_ms=int(not_before * 1000)))
+    assert not await RevocationService().is_revoked(token(issued_at_ms=int(not_before * 1000) + 1))
+    assert not await RevocationService().is_revoked(token(subject='alan@example.com', issued_at_ms=0))
+
+
+async def test_revoke_user_accepts_tokens_without_iat_ms() -> None:
+    await RevocationService().revoke_user(subject='ada@example.com')
+
+    legacy: Dict[str, Any] = token(issued_at_ms=int(time.time() * 1000) - 2000)
+    del legacy['iat_ms']
+
+    assert RevocationService().issued_at_ms(legacy) == legacy['iat'] * 1000
+    assert await RevocationService().is_revoked(legacy)
+
+
+async def test_memory_store_sync_drops_expired_tokens() -> None:
+    revocations: RevocationList = revocation.revocation_list
+    live: Dict[str, Any] = token()
+    expired: Dict[str, Any] = token()
+
+    await RevocationService().revoke_token(jti=live['jti'], expires_at=time.time() + 60)
+    await revocations.store.add_token(expired['jti'], time.time() - 1)
+    await RevocationService().sync()
+
+    assert live['jti'] in revocations.bloom
+    assert await RevocationService().is_revoked(live)
+    assert not await RevocationService().is_revoked(expired)
+
+
+async def test_sync_shares_revocations_between_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(redis_helper, 'client', FakeAsyncRedis())
+
+    first: RevocationList = worker()
+    second: RevocationList = worker()
+    revoked: Dict[str, Any] = token()
+    issued_before: Dict[str, Any] = token(subject='alan@example.com', issued_at_ms=int(time.time() * 1000) - 1)
+
+    monkeypatch.setattr(revocation, 'revocation_list', first)
+    await RevocationService().revoke_token(jti=revoked['jti'], expires_at=revoked['exp'])
+    await RevocationService().revoke_user(subject='alan@example.com')
+
+    monkeypatch.setattr(revocation, 'revocation_list', second)
+
+    assert not await RevocationService().is_revoked(revoked)
+    assert not await RevocationService().is_revoked(issued_before)
+
+    await RevocationService().sync()
+
+    assert revoked['jti'] in second.bloom
+    assert second.users['alan@example.com'] == pytest.approx(first.users['alan@example.com'])
+    assert await RevocationService().is_revoked(revoked)
+    assert await RevocationService().is_revoked(issued_before)
+
+
+async def test_sync_keeps_newer_local_user_cutoffs(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(redis_helper, 'client', FakeAsyncRedis())
+
+    revocations: RevocationList = worker()
+    await revocations.store.set_user('ada@example.com', time.time() - 60)
+    revocations.users['ada@example.com'] = time.time()
+
+    await revocations.sync()
+
+    assert revocations.users['ada@example.com'] > time.time() - 1
@@ -0,0 +1,158 @@
+import asyncio
+from pathlib import Path
+from typing import AsyncGenerator, List
+
+import pytest
+from sqlalchemy import Select, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.api.v1.services.cache import principal_cache
+from src.api.v1.services.crud import CRUDService
+from src.database import Base, User
+from src.database.helper import DatabaseHelper
+from src.database.routing import primary_pinned
+
+
+pytestmark = pytest.mark.anyio
+
+WHICH: Select = select(User.first_name).where(User.email == 'marker@example.com')
+
+
+async def create_database(engine: AsyncEngine, name: str) -> None:
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with engine.begin() as connection:
+        await connection.execute(User.__table__.insert().values(
+            first_name=name,
+            last_name='Marker',
+            email='marker@example.com',
+            hashed_password='x',
+        ))
+
+
+@pytest.fixture
+async def helper(tmp_path: Path) -> AsyncGenerator[DatabaseHelper, None]:
+    helper: DatabaseHelper = DatabaseHelper(
+        url=f'sqlite+aiosqlite:///{tmp_path / "primary.db"}',
+        replicas=[f'sqlite+aiosqlite:///{tmp_path / "replica.db"}'],
+    )
+
+    await create_database(helper.engine, 'primary')
+    await create_database(helper.replicas.replicas[0].engine, 'replica')
+
+    yield helper
+
+    await helper.dispose()
+
+
+@pytest.fixture(autouse=True)
+def unpinned() -> None:
+    primary_pinned.set(False)
+
+
+async def read_marker(helper: DatabaseHelper) -> str:
+    async with helper.read_session_factory() as session:
+        return (await session.execute(WHICH)).scalar_one()
+
+
+async def test_reads_go_to_the_replica(helper: DatabaseHelper) -> None:
+    assert await read_marker(helper) == 'replica'
+
+
+async def test_writes_go_to_the_primary(helper: DatabaseHelper) -> None:
+    async with helper.read_session_factory() as session:
+        await session.execute(
+            update(User).where(User.email == 'marker@example.com').values(last_name='Written')
+        )
+        await session.commit()
+
+    async with helper.session_factory() as session:
+        primary: str = (await session.execute(
+            select(User.last_name).where(User.email == 'marker@example.com')
+        )).scalar_one()
+
+    async with helper.replicas.replicas[0].engine.connect() as connection:
+        replica: str = (await connection.execute(
+            select(User.last_name).where(User.email == 'marker@example.com')
+        )).scalar_one()
+
+    assert (primary, replica) == ('Written', 'Marker')
+
+
+async def test_session_stays_on_the_primary_after_a_write(helper: DatabaseHelper) -> None:
+    async with helper.read_session_factory() as session:
+        await session.execute(
+            update(User).where(User.email == 'marker@example.com').values(last_name='Written')
+        )
+
+        assert (await session.execute(WHICH)).scalar_one() == 'primary'
+
+
+async def test_reads_after_a_commit_stay_on_the_primary(helper: DatabaseHelper) -> None:
+    async def request() -> List[str]:
+        before: str = await read_marker(helper)
+
+        async with helper.read_session_factory() as session:
+            await session.execute(
+                update(User).where(User.email == 'marker@example.com').values(last_name='Written')
+            )
+            await session.commit()
+
+        return [before, await read_marker(helper)]
+
+    # Each request runs in its own task, so the pin ends with it
+    assert await asyncio.create_task(request()) == ['replica', 'primary']
+    assert await read_marker(helper) == 'replica'
+
+
+async def test_read_only_commit_does_not_pin(helper: DatabaseHelper) -> None:
+    async with helper.read_session_factory() as session:
+        await session.execute(WHICH)
+        await session.commit()
+
+    assert await read_marker(helper) == 'replica'
+
+
+async def test_unhealthy_replica_falls_back_to_the_primary(helper: DatabaseHelper) -> None:
+    helper.replicas.mark(helper.replicas.replicas[0], healthy=False)
+
+    assert await read_marker(helper) == 'primary'
+
+    await helper.replicas.check(timeout=1)
+
+    assert helper.replicas.replicas[0].healthy
+    assert await read_marker(helper) == 'replica'
+
+
+async def test_unreachable_replica_is_marked_unhealthy(tmp_path: Path) -> None:
+    helper: DatabaseHelper = DatabaseHelper(
+        url=f'sqlite+aiosqlite:///{tmp_path / "primary.db"}',
+        replicas=[f'sqlite+aiosqlite:///{tmp_path / "missing" / "replica.db"}'],
+    )
+    await create_database(helper.engine, 'primary')
+
+    await helper.replicas.check(timeout=1)
+
+    assert not helper.replicas.replicas[0].healthy
+    assert await read_marker(helper) == 'primary'
+
+    await helper.dispose()
+
+
+async def test_newer_token_version_falls_back_to_the_primary(helper: DatabaseHelper) -> None:
+    async with helper.session_factory() as session:
+        await session.execute(
+            update(User).where(User.email == 'marker@example.com').values(token_version=1)
+        )
+        await session.commit()
+
+    async with helper.read_session_factory() as session:
+        user: User = await CRUDService().get_cached_user_by_email(
+            session=session,
+            email='marker@example.com',
+            token_version=1
+        )
+
+    assert (user.first_name, user.token_version) == ('primary', 1)
+    assert principal_cache.get('marker@example.com')['token_version'] == 1